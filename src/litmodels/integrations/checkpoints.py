@@ -1,37 +1,52 @@
+import hashlib
 import inspect
 import os.path
 import queue
 import threading
 from abc import ABC
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
-from functools import cache
+from functools import cache, cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from lightning_sdk.lightning_cloud.login import Auth
 from lightning_sdk.utils.resolve import _resolve_teamspace
 from lightning_utilities import StrEnum
+from lightning_utilities.core.apply_func import apply_to_collection
 from lightning_utilities.core.rank_zero import rank_zero_debug, rank_zero_only, rank_zero_warn
 
 from litmodels import upload_model
 from litmodels.integrations.imports import _LIGHTNING_AVAILABLE, _PYTORCHLIGHTNING_AVAILABLE
-from litmodels.io.cloud import _list_available_teamspaces, delete_model_version
+from litmodels.io.cloud import _check_compression, _list_available_teamspaces, delete_model_version
 
 if _LIGHTNING_AVAILABLE:
+    from lightning.fabric.plugins import CheckpointIO
     from lightning.pytorch.callbacks import ModelCheckpoint as _LightningModelCheckpoint
 
 
 if _PYTORCHLIGHTNING_AVAILABLE:
     from pytorch_lightning.callbacks import ModelCheckpoint as _PytorchLightningModelCheckpoint
 
+    if not _LIGHTNING_AVAILABLE:
+        from lightning_fabric.plugins import CheckpointIO  # type: ignore[assignment]
+
 
 if TYPE_CHECKING:
+    import torch
+
     if _LIGHTNING_AVAILABLE:
         import lightning.pytorch as pl
     if _PYTORCHLIGHTNING_AVAILABLE:
         import pytorch_lightning as pl
 
 
+_DEFAULT_MAX_PENDING = "4"
+# seconds to wait for a free upload slot before warning that training is throttled by uploads
+_QUEUE_FULL_WARN_TIMEOUT = 30
+
+
 # Create a singleton upload manager
 @cache
 def get_model_manager() -> "ModelManager":
@@ -43,10 +58,34 @@ def get_model_manager() -> "ModelManager":
     return ModelManager()
 
 
+@cache
+def _authenticate() -> Auth:
+    """Authenticate with Lightning Cloud once per process.
+
+    Returns:
+        Auth: The authenticated client credentials, shared by all checkpoint callbacks.
+    """
+    auth = Auth()
+    auth.authenticate()
+    return auth
+
+
+def _file_sha256(path: Union[str, Path], chunk_size: int = 4 * 1024 * 1024) -> Optional[str]:
+    """Compute the SHA-256 digest of a file, or return None if the path is not a file."""
+    if not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        while chunk := fp.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 # enumerate the possible actions
 class Action(StrEnum):
     """Enumeration of possible actions for the ModelManager."""
 
+    SAVE = "save"
     UPLOAD = "upload"
     REMOVE = "remove"
 
@@ -58,20 +97,185 @@ class RemoveType(StrEnum):
     CLOUD = "cloud"
 
 
-class ModelManager:
-    """Manage asynchronous uploads and removals via a single worker queue.
+class _CheckpointSnapshot:
+    """Host-memory copy of a checkpoint which can be written to disk while training continues.
 
-    This manager runs a daemon worker thread that processes queued upload and removal tasks.
-    It maintains separate counters for pending uploads and removals and supports graceful shutdown.
+    Tensors are copied into CPU buffers allocated once from the first checkpoint (pinned if the source is on CUDA)
+    and reused for every following checkpoint. CUDA copies are issued on a dedicated stream, so taking the snapshot
+    does not wait for the device-to-host transfer. Only one snapshot is in flight at a time; taking the next one
+    waits until the previous one was released by the writer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty buffers; they are sized from the first checkpoint."""
+        self._buffers: list[torch.Tensor] = []
+        self._stream: Optional[torch.cuda.Stream] = None
+        self._event: Optional[torch.cuda.Event] = None
+        self._released = threading.Event()
+        self._released.set()
+
+    def __getstate__(self) -> dict:
+        """Get the state of the snapshot for pickling, without buffers and synchronization primitives."""
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        """Set the state of the snapshot after unpickling."""
+        self._buffers = []
+        self._stream = None
+        self._event = None
+        self._released = threading.Event()
+        self._released.set()
+
+    def take(self, checkpoint: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Copy all tensors of the checkpoint into the reusable host buffers.
+
+        Args:
+            checkpoint: The checkpoint dictionary as produced by the Trainer.
+
+        Returns:
+            The checkpoint with every tensor replaced by its host copy, or None if the checkpoint holds tensors
+            which cannot be copied into plain buffers (for example sparse or distributed tensors).
+        """
+        import torch
+
+        tensors: dict[int, torch.Tensor] = {}
+        apply_to_collection(checkpoint, torch.Tensor, lambda t: tensors.setdefault(id(t), t))
+        if any(type(t) is not torch.Tensor or t.layout != torch.strided for t in tensors.values()):
+            return None
+
+        # the buffers of the previous snapshot can be reused only once it was written
+        self._released.wait()
+        self._released.clear()
+        try:
+            on_cuda = any(t.is_cuda for t in tensors.values())
+            buffers = []
+            for i, src in enumerate(tensors.values()):
+                buf = self._buffers[i] if i < len(self._buffers) else None
+                if buf is None or buf.shape != src.shape or buf.dtype != src.dtype or buf.is_pinned() != on_cuda:
+                    buf = torch.empty(src.shape, dtype=src.dtype, device="cpu", pin_memory=on_cuda)
+                buffers.append(buf)
+            self._buffers = buffers
+
+            if on_cuda:
+                device = next(t.device for t in tensors.values() if t.is_cuda)
+                if self._stream is None or self._stream.device != device:
+                    self._stream = torch.cuda.Stream(device=device)
+                stream = self._stream
+                stream.wait_stream(torch.cuda.current_stream(device))
+                with torch.cuda.stream(stream):
+                    for src, buf in zip(tensors.values(), buffers):
+                        buf.copy_(src.detach(), non_blocking=True)
+                        if src.is_cuda:
+                            src.record_stream(stream)
+                self._event = torch.cuda.Event()
+                self._event.record(stream)
+            else:
+                for src, buf in zip(tensors.values(), buffers):
+                    buf.copy_(src.detach())
+                self._event = None
+        except BaseException:
+            # nothing will write this snapshot, so free the buffers for the next one
+            self.release()
+            raise
+
+        index = {key: i for i, key in enumerate(tensors)}
+        return apply_to_collection(checkpoint, torch.Tensor, lambda t: buffers[index[id(t)]])
+
+    def synchronize(self) -> None:
+        """Wait until the device-to-host copies of the last snapshot are finished."""
+        if self._event is not None:
+            self._event.synchronize()
+
+    def release(self) -> None:
+        """Mark the buffers as free so the next snapshot can reuse them."""
+        self._released.set()
+
+
+if _LIGHTNING_AVAILABLE or _PYTORCHLIGHTNING_AVAILABLE:
+
+    class _DeferredCheckpointIO(CheckpointIO):
+        """Wrap a ``CheckpointIO`` plugin so saving snapshots the checkpoint and writes it in the background."""
+
+        def __init__(self, checkpoint_io: CheckpointIO, snapshot: _CheckpointSnapshot) -> None:
+            self._checkpoint_io = checkpoint_io
+            self._snapshot = snapshot
+
+        def __getattr__(self, name: str) -> Any:
+            """Delegate custom attributes of the wrapped plugin."""
+            return getattr(self._checkpoint_io, name)
+
+        def save_checkpoint(
+            self, checkpoint: dict[str, Any], path: Union[str, Path], storage_options: Optional[Any] = None
+        ) -> None:
+            """Snapshot the checkpoint and queue writing it to ``path``."""
+            snapshot = self._snapshot.take(checkpoint)
+            if snapshot is None:
+                rank_zero_debug(f"Checkpoint cannot be snapshotted, saving synchronously: {path}")
+                self._checkpoint_io.save_checkpoint(checkpoint, path, storage_options=storage_options)
+                return
+            get_model_manager().queue_save(
+                checkpoint_io=self._checkpoint_io,
+                checkpoint=snapshot,
+                filepath=path,
+                storage_options=storage_options,
+                snapshot=self._snapshot,
+            )
+
+        def load_checkpoint(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            """Load the checkpoint with the wrapped plugin."""
+            return self._checkpoint_io.load_checkpoint(*args, **kwargs)
+
+        def remove_checkpoint(self, *args: Any, **kwargs: Any) -> None:
+            """Remove the checkpoint with the wrapped plugin."""
+            self._checkpoint_io.remove_checkpoint(*args, **kwargs)
+
+        def teardown(self) -> None:
+            """Tear down the wrapped plugin."""
+            self._checkpoint_io.teardown()
+
+
+class ModelManager:
+    """Manage asynchronous saves, uploads and removals via a single worker queue.
+
+    This manager runs a daemon worker thread that processes queued save, upload and removal tasks in order.
+    An upload which gets superseded by a newer upload to the same registry name before it starts is skipped, as is
+    an upload of a file identical to the one last uploaded to the same registry name.
+    The number of pending uploads is bounded, so when uploads cannot keep up, queuing an upload blocks training
+    instead of letting pending checkpoints accumulate in memory and on disk. A superseded upload does not count
+    towards the bound.
+    It maintains separate counters for pending saves, uploads and removals, collects the errors of failed tasks
+    and supports waiting for all pending tasks as well as graceful shutdown.
     """
 
     task_queue: queue.Queue
 
-    def __init__(self) -> None:
-        """Initialize the manager with a task queue, counters, and a daemon worker thread."""
+    def __init__(self, max_pending: Optional[int] = None) -> None:
+        """Initialize the manager with a task queue, counters, and a daemon worker thread.
+
+        Args:
+            max_pending: Maximum number of not yet started uploads before queuing another one blocks the caller,
+                defaults to the ``LITMODELS_MAX_PENDING`` environment variable or 4. Non-positive values disable
+                the bound.
+        """
+        if max_pending is None:
+            max_pending = int(os.environ.get("LITMODELS_MAX_PENDING", _DEFAULT_MAX_PENDING))
+        self._max_pending = max_pending
         self.task_queue = queue.Queue()
+        self.save_count = 0
         self.upload_count = 0
         self.remove_count = 0
+        # the latest queued upload per registry name, older ones are superseded
+        self._pending_uploads: dict[str, tuple] = {}
+        # size, modification time and (if computed) content digest of the last upload per registry name
+        self._uploaded_signatures: dict[str, tuple[int, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        # notified whenever an upload leaves the pending uploads
+        self._upload_started = threading.Condition(self._lock)
+        # number of queued tasks which are not finished yet, the event is set whenever it drops to zero
+        self._pending_tasks = 0
+        self._all_done = threading.Event()
+        self._all_done.set()
+        self._errors: list[Exception] = []
         self._worker = threading.Thread(target=self._worker_loop, daemon=True)
         self._worker.start()
 
@@ -79,7 +283,13 @@ class ModelManager:
         """Get the state of the ModelManager for pickling."""
         state = self.__dict__.copy()
         del state["task_queue"]
+        del state["_lock"]
+        del state["_upload_started"]
         del state["_worker"]
+        del state["_all_done"]
+        state["_pending_uploads"] = {}
+        state["_pending_tasks"] = 0
+        state["_errors"] = []
         return state
 
     def __setstate__(self, state: dict) -> None:
@@ -89,9 +299,84 @@ class ModelManager:
         import threading
 
         self.task_queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._upload_started = threading.Condition(self._lock)
+        self._all_done = threading.Event()
+        self._all_done.set()
         self._worker = threading.Thread(target=self._worker_loop, daemon=True)
         self._worker.start()
 
+    def _put(self, task: Optional[tuple]) -> None:
+        """Put a task on the queue and count it as pending."""
+        if task is not None:
+            with self._lock:
+                self._pending_tasks += 1
+                self._all_done.clear()
+        self.task_queue.put(task)
+
+    def _add_pending_upload(self, registry_name: str, detail: tuple) -> None:
+        """Make the upload the latest pending one of its registry name, waiting for a free slot if needed.
+
+        A pending upload to the same registry name is superseded and hands its slot over, so only uploads to new
+        registry names wait while ``max_pending`` uploads are pending.
+        """
+
+        def _has_slot() -> bool:
+            return (
+                registry_name in self._pending_uploads
+                or self._max_pending <= 0
+                or len(self._pending_uploads) < self._max_pending
+            )
+
+        with self._upload_started:
+            if not self._upload_started.wait_for(_has_slot, timeout=_QUEUE_FULL_WARN_TIMEOUT):
+                rank_zero_warn(
+                    f"The upload queue is full ({self._max_pending} pending uploads), waiting for uploads to catch"
+                    " up. Consider saving checkpoints less frequently or raising `LITMODELS_MAX_PENDING`."
+                )
+                self._upload_started.wait_for(_has_slot)
+            self._pending_uploads[registry_name] = detail
+
+    def _task_done(self, error: Optional[Exception] = None) -> None:
+        """Mark a queued task as finished, recording its error if it failed."""
+        with self._lock:
+            if error is not None:
+                self._errors.append(error)
+            self._pending_tasks -= 1
+            if not self._pending_tasks:
+                self._all_done.set()
+        self.task_queue.task_done()
+
+    def _is_superseded(self, registry_name: str, detail: tuple) -> bool:
+        """Check whether a newer upload to the same registry name was queued, and drop this one from pending."""
+        with self._upload_started:
+            if self._pending_uploads.get(registry_name) is not detail:
+                return True
+            del self._pending_uploads[registry_name]
+            self._upload_started.notify_all()
+        return False
+
+    def _check_uploaded(
+        self, registry_name: str, filepath: Union[str, Path]
+    ) -> tuple[bool, Optional[tuple[int, Optional[str]]]]:
+        """Check whether the file is identical to the last upload to the same registry name.
+
+        Only a registry version uploaded before, like ``last``, can match, so unique versions are never hashed.
+        A different size means a changed file; a file of the same size is always hashed to compare the contents,
+        since modification times are too coarse to tell a quickly rewritten file apart.
+
+        Returns:
+            Whether the file was uploaded already, and its signature to remember for the registry name.
+        """
+        if not os.path.isfile(filepath):
+            return False, None
+        size = os.path.getsize(filepath)
+        previous = self._uploaded_signatures.get(registry_name)
+        if previous is None or previous[0] != size:
+            return False, (size, None)
+        digest = _file_sha256(filepath)
+        return digest is not None and digest == previous[1], (size, digest)
+
     def _worker_loop(self) -> None:
         while True:
             task = self.task_queue.get()
@@ -99,13 +384,38 @@ class ModelManager:
                 self.task_queue.task_done()
                 break
             action, detail = task
-            if action == Action.UPLOAD:
-                registry_name, filepath, metadata = detail
+            error = None
+            if action == Action.SAVE:
+                checkpoint_io, checkpoint, filepath, storage_options, snapshot = detail
+                try:
+                    snapshot.synchronize()
+                    checkpoint_io.save_checkpoint(checkpoint, filepath, storage_options=storage_options)
+                    rank_zero_debug(f"Finished saving: {filepath}")
+                except Exception as ex:
+                    rank_zero_warn(f"Saving failed {filepath}: {ex}")
+                    error = ex
+                finally:
+                    snapshot.release()
+                    self.save_count -= 1
+            elif action == Action.UPLOAD:
+                registry_name, filepath, metadata, compression = detail
+                if self._is_superseded(registry_name, detail):
+                    rank_zero_debug(f"Skipped superseded upload: {filepath}")
+                    self.upload_count -= 1
+                    self._task_done()
+                    continue
                 try:
-                    upload_model(name=registry_name, model=filepath, metadata=metadata)
-                    rank_zero_debug(f"Finished uploading: {filepath}")
+                    uploaded, signature = self._check_uploaded(registry_name, filepath)
+                    if uploaded:
+                        rank_zero_debug(f"Skipped uploading identical checkpoint: {filepath}")
+                    else:
+                        upload_model(name=registry_name, model=filepath, metadata=metadata, compression=compression)
+                        rank_zero_debug(f"Finished uploading: {filepath}")
+                    if signature:
+                        self._uploaded_signatures[registry_name] = signature
                 except Exception as ex:
                     rank_zero_warn(f"Upload failed {filepath}: {ex}")
+                    error = ex
                 finally:
                     self.upload_count -= 1
             elif action == Action.REMOVE:
@@ -121,16 +431,38 @@ class ModelManager:
                         trainer.strategy.remove_checkpoint(filepath)
                 except Exception as ex:
                     rank_zero_warn(f"Removal failed {filepath}: {ex}")
+                    error = ex
                 finally:
                     self.remove_count -= 1
             else:
                 rank_zero_warn(f"Unknown task: {task}")
-            self.task_queue.task_done()
-
-    def queue_upload(self, registry_name: str, filepath: Union[str, Path], metadata: Optional[dict] = None) -> None:
-        """Queue an upload task."""
+            self._task_done(error)
+
+    def queue_save(
+        self,
+        checkpoint_io: Any,
+        checkpoint: dict[str, Any],
+        filepath: Union[str, Path],
+        storage_options: Any,
+        snapshot: _CheckpointSnapshot,
+    ) -> None:
+        """Queue writing a snapshotted checkpoint with the given ``CheckpointIO`` plugin."""
+        self.save_count += 1
+        self._put((Action.SAVE, (checkpoint_io, checkpoint, filepath, storage_options, snapshot)))
+        rank_zero_debug(f"Queued save: {filepath} (pending saves: {self.save_count})")
+
+    def queue_upload(
+        self,
+        registry_name: str,
+        filepath: Union[str, Path],
+        metadata: Optional[dict] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        """Queue an upload task, superseding any not yet started upload to the same registry name."""
+        detail = (registry_name, filepath, metadata, compression)
+        self._add_pending_upload(registry_name, detail)
         self.upload_count += 1
-        self.task_queue.put((Action.UPLOAD, (registry_name, filepath, metadata)))
+        self._put((Action.UPLOAD, detail))
         rank_zero_debug(f"Queued upload: {filepath} (pending uploads: {self.upload_count})")
 
     def queue_remove(
@@ -138,12 +470,27 @@ class ModelManager:
     ) -> None:
         """Queue a removal task."""
         self.remove_count += 1
-        self.task_queue.put((Action.REMOVE, (filepath, trainer, registry_name)))
+        self._put((Action.REMOVE, (filepath, trainer, registry_name)))
         rank_zero_debug(f"Queued removal: {filepath} (pending removals: {self.remove_count})")
 
+    def wait_all(self, timeout: Optional[float] = None) -> list[Exception]:
+        """Wait until all queued tasks are finished, keeping the worker running for later tasks.
+
+        Args:
+            timeout: Maximal number of seconds to wait, or None to wait until all tasks are finished.
+
+        Returns:
+            The errors of the tasks which failed since the last call.
+        """
+        if not self._all_done.wait(timeout):
+            rank_zero_warn(f"Background tasks are still running after {timeout} seconds.")
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
     def shutdown(self) -> None:
         """Shut down the manager and wait for all tasks to complete."""
-        self.task_queue.put(None)
+        self._put(None)
         self.task_queue.join()
         rank_zero_debug("Manager shut down.")
 
@@ -152,16 +499,22 @@ class ModelManager:
 class LitModelCheckpointMixin(ABC):
     """Mixin adding upload/remove behavior for Lightning checkpoint callbacks.
 
-    This mixin queues uploads to Lightning Cloud upon checkpoint save and can optionally
+    This mixin queues uploads to Lightning Cloud upon checkpoint save and can optionally write checkpoints from
+    a host-memory snapshot in the background,
     remove local checkpoints or skip cloud-side pruning based on configuration.
     """
 
-    _datetime_stamp: str
     model_registry: Optional[str] = None
     _model_manager: ModelManager
+    _snapshot: _CheckpointSnapshot
 
     def __init__(
-        self, model_registry: Optional[str], keep_all_uploaded: bool = False, clear_all_local: bool = False
+        self,
+        model_registry: Optional[str],
+        keep_all_uploaded: bool = False,
+        clear_all_local: bool = False,
+        compression: Optional[str] = None,
+        background_save: bool = False,
     ) -> None:
         """Configure model registry and pruning behavior.
 
@@ -169,23 +522,45 @@ class LitModelCheckpointMixin(ABC):
             model_registry: Target model registry in the form 'organization/teamspace/modelname'.
             keep_all_uploaded: If True, never delete uploaded cloud versions even if local pruning occurs.
             clear_all_local: If True, remove local checkpoint files after they are uploaded to cloud.
+            compression: Optional compression of large checkpoints before upload, only 'zstd' is supported.
+            background_save: If True, write checkpoints from a host-memory snapshot in a background thread so
+                training continues during the write. Loggers notified of a saved checkpoint may then find the file
+                missing or incomplete, and an interpreter exit may interrupt the write.
         """
         if not model_registry:
             rank_zero_warn(
                 "The model is not defined so we will continue with LightningModule names and timestamp of now"
             )
-        self._datetime_stamp = datetime.now().strftime("%Y%m%d-%H%M")
         # remove any / from beginning and end of the name
         self.model_registry = model_registry.strip("/") if model_registry else None
         self._keep_all_uploaded = keep_all_uploaded
         self._clear_all_local = clear_all_local
+        _check_compression(compression)
+        self._compression = compression
+        self._background_save = background_save
 
         try:  # authenticate before anything else starts
-            Auth().authenticate()
+            _authenticate()
         except Exception:
             raise ConnectionError("Unable to authenticate with Lightning Cloud. Check your credentials.")
 
-        self._model_manager = ModelManager()
+        # start the background worker now, typically before the Trainer initializes CUDA and starts training
+        self._model_manager = get_model_manager()
+        self._snapshot = _CheckpointSnapshot()
+
+    @contextmanager
+    def _defer_checkpoint_write(self, trainer: "pl.Trainer") -> Iterator[None]:
+        """Write checkpoints saved within this context in the background if enabled, from a host-memory snapshot."""
+        if not self._background_save:
+            yield
+            return
+        strategy = trainer.strategy
+        checkpoint_io = strategy.checkpoint_io
+        strategy.checkpoint_io = _DeferredCheckpointIO(checkpoint_io, self._snapshot)
+        try:
+            yield
+        finally:
+            strategy.checkpoint_io = checkpoint_io
 
     @rank_zero_only
     def _upload_model(self, trainer: "pl.Trainer", filepath: Union[str, Path], metadata: Optional[dict] = None) -> None:
@@ -195,7 +570,8 @@ class LitModelCheckpointMixin(ABC):
                 " Please set the model name before uploading or ensure that `setup` method is called."
             )
         model_registry = self.model_registry
-        if os.path.isfile(filepath):
+        # the checkpoint file may still be written in the background, so it does not need to exist yet
+        if not os.path.isdir(filepath):
             # parse the file name as version
             version, _ = os.path.splitext(os.path.basename(filepath))
             model_registry += f":{version}"
@@ -207,10 +583,21 @@ class LitModelCheckpointMixin(ABC):
         ckpt_class = mro[abc_index - 1]
         metadata.update({"litModels.integration": ckpt_class.__name__})
         # Add to queue instead of uploading directly
-        get_model_manager().queue_upload(registry_name=model_registry, filepath=filepath, metadata=metadata)
+        get_model_manager().queue_upload(
+            registry_name=model_registry, filepath=filepath, metadata=metadata, compression=self._compression
+        )
         if self._clear_all_local:
             get_model_manager().queue_remove(filepath=filepath, trainer=trainer)
 
+    def _wait_for_background_tasks(self) -> None:
+        """Wait until all queued saves, uploads and removals are finished and report the failed ones."""
+        errors = get_model_manager().wait_all()
+        if errors:
+            rank_zero_warn(
+                f"{len(errors)} background checkpoint task(s) failed, the latest checkpoints may not be uploaded: "
+                + "; ".join(repr(err) for err in errors)
+            )
+
     @rank_zero_only
     def _remove_model(self, trainer: "pl.Trainer", filepath: Union[str, Path]) -> None:
         """Queue removal of local and/or cloud artifacts according to configuration."""
@@ -222,42 +609,43 @@ class LitModelCheckpointMixin(ABC):
             registry_name=None if self._keep_all_uploaded else self.model_registry,
         )
 
+    @cached_property
+    def _datetime_stamp(self) -> str:
+        """Timestamp used in the default model name, taken on first use and kept for the callback's lifetime."""
+        return datetime.now().strftime("%Y%m%d-%H%M")
+
     def default_model_name(self, pl_model: "pl.LightningModule") -> str:
         """Generate a default model name using the LightningModule class name and a timestamp."""
         return pl_model.__class__.__name__ + f"_{self._datetime_stamp}"
 
     def _update_model_name(self, pl_model: "pl.LightningModule") -> None:
         """Update the model name if not already set."""
-        count_slashes_in_name = self.model_registry.count("/") if self.model_registry else 0
-        default_model_name = self.default_model_name(pl_model)
-        if count_slashes_in_name > 2:
+        parts = self.model_registry.split("/", 3) if self.model_registry else []
+        if len(parts) > 3:
             raise ValueError(
                 f"Invalid model name: '{self.model_registry}'. It should not contain more than two '/' character."
             )
-        if count_slashes_in_name == 2:
+        if len(parts) == 3:
             # user has defined the model name in the format 'organization/teamspace/modelname'
             return
-        if count_slashes_in_name == 1:
+        default_model_name = self.default_model_name(pl_model)
+        if len(parts) == 2:
             # user had defined only the teamspace name
             self.model_registry = f"{self.model_registry}/{default_model_name}"
-        elif count_slashes_in_name == 0:
-            if not self.model_registry:
-                self.model_registry = default_model_name
-            teamspace = _resolve_teamspace(None, None, None)
-            if teamspace:
-                # case you use default model name and teamspace determined from env. variables aka running in studio
-                self.model_registry = f"{teamspace.owner.name}/{teamspace.name}/{self.model_registry}"
-            else:  # try to load default users teamspace
-                ts_names = list(_list_available_teamspaces().keys())
-                if len(ts_names) == 1:
-                    self.model_registry = f"{ts_names[0]}/{self.model_registry}"
-                else:
-                    options = "\n\t".join(ts_names)
-                    raise RuntimeError(
-                        f"Teamspace is not defined and there are multiple teamspaces available:\n{options}"
-                    )
-        else:
-            raise RuntimeError(f"Invalid model name: '{self.model_registry}'")
+            return
+        if not self.model_registry:
+            self.model_registry = default_model_name
+        teamspace = _resolve_teamspace(None, None, None)
+        if teamspace:
+            # case you use default model name and teamspace determined from env. variables aka running in studio
+            self.model_registry = f"{teamspace.owner.name}/{teamspace.name}/{self.model_registry}"
+        else:  # try to load default users teamspace
+            ts_names = list(_list_available_teamspaces().keys())
+            if len(ts_names) == 1:
+                self.model_registry = f"{ts_names[0]}/{self.model_registry}"
+            else:
+                options = "\n\t".join(ts_names)
+                raise RuntimeError(f"Teamspace is not defined and there are multiple teamspaces available:\n{options}")
 
 
 # Create specific implementations
@@ -270,6 +658,8 @@ if _LIGHTNING_AVAILABLE:
             model_registry: Target model registry in the form 'organization/teamspace/modelname'.
             keep_all_uploaded: If True, does not remove cloud versions when local pruning occurs.
             clear_all_local: If True, removes local checkpoint files after successful upload.
+            compression: Optional compression of large checkpoints before upload, only 'zstd' is supported.
+            background_save: If True, write checkpoints in a background thread from a host-memory snapshot.
             *args: Additional positional arguments forwarded to the base ModelCheckpoint.
             **kwargs: Additional keyword arguments forwarded to the base ModelCheckpoint.
         """
@@ -281,6 +671,8 @@ if _LIGHTNING_AVAILABLE:
             model_registry: Optional[str] = None,
             keep_all_uploaded: bool = False,
             clear_all_local: bool = False,
+            compression: Optional[str] = None,
+            background_save: bool = False,
             **kwargs: Any,
         ) -> None:
             """Initialize the checkpoint with model name and other parameters."""
@@ -295,6 +687,8 @@ if _LIGHTNING_AVAILABLE:
                 model_registry=model_registry or model_name,
                 keep_all_uploaded=keep_all_uploaded,
                 clear_all_local=clear_all_local,
+                compression=compression,
+                background_save=background_save,
             )
 
         def setup(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", stage: str) -> None:
@@ -303,8 +697,9 @@ if _LIGHTNING_AVAILABLE:
             self._update_model_name(pl_module)
 
         def _save_checkpoint(self, trainer: "pl.Trainer", filepath: str) -> None:
-            """Save the checkpoint and queue an upload from the global-zero process."""
-            _LightningModelCheckpoint._save_checkpoint(self, trainer, filepath)
+            """Save the checkpoint, in the background if enabled, and queue an upload from the global-zero process."""
+            with self._defer_checkpoint_write(trainer):
+                _LightningModelCheckpoint._save_checkpoint(self, trainer, filepath)
             if trainer.is_global_zero:  # Only upload from the main process
                 self._upload_model(trainer=trainer, filepath=filepath)
 
@@ -312,7 +707,7 @@ if _LIGHTNING_AVAILABLE:
             """Extend the on_fit_end method to ensure all uploads are completed."""
             _LightningModelCheckpoint.on_fit_end(self, trainer, pl_module)
             # Wait for all uploads to finish
-            get_model_manager().shutdown()
+            self._wait_for_background_tasks()
 
         def _remove_checkpoint(self, trainer: "pl.Trainer", filepath: str) -> None:
             """Extend the remove checkpoint method to remove the model from the registry."""
@@ -329,6 +724,8 @@ if _PYTORCHLIGHTNING_AVAILABLE:
             model_registry: Name of the model to upload in format 'organization/teamspace/modelname'.
             keep_all_uploaded: If True, does not remove cloud versions when local pruning occurs.
             clear_all_local: If True, removes local checkpoint files after successful upload.
+            compression: Optional compression of large checkpoints before upload, only 'zstd' is supported.
+            background_save: If True, write checkpoints in a background thread from a host-memory snapshot.
             args: Additional positional arguments forwarded to the base ModelCheckpoint.
             kwargs: Additional keyword arguments forwarded to the base ModelCheckpoint.
         """
@@ -340,6 +737,8 @@ if _PYTORCHLIGHTNING_AVAILABLE:
             model_registry: Optional[str] = None,
             keep_all_uploaded: bool = False,
             clear_all_local: bool = False,
+            compression: Optional[str] = None,
+            background_save: bool = False,
             **kwargs: Any,
         ) -> None:
             """Initialize the checkpoint with model name and other parameters."""
@@ -354,6 +753,8 @@ if _PYTORCHLIGHTNING_AVAILABLE:
                 model_registry=model_registry or model_name,
                 keep_all_uploaded=keep_all_uploaded,
                 clear_all_local=clear_all_local,
+                compression=compression,
+                background_save=background_save,
             )
 
         def setup(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", stage: str) -> None:
@@ -362,8 +763,9 @@ if _PYTORCHLIGHTNING_AVAILABLE:
             self._update_model_name(pl_module)
 
         def _save_checkpoint(self, trainer: "pl.Trainer", filepath: str) -> None:
-            """Extend the save checkpoint method to upload the model."""
-            _PytorchLightningModelCheckpoint._save_checkpoint(self, trainer, filepath)
+            """Extend the save checkpoint method to optionally write the file in the background and upload the model."""
+            with self._defer_checkpoint_write(trainer):
+                _PytorchLightningModelCheckpoint._save_checkpoint(self, trainer, filepath)
             if trainer.is_global_zero:  # Only upload from the main process
                 self._upload_model(trainer=trainer, filepath=filepath)
 
@@ -371,7 +773,7 @@ if _PYTORCHLIGHTNING_AVAILABLE:
             """Extend the on_fit_end method to ensure all uploads are completed."""
             _PytorchLightningModelCheckpoint.on_fit_end(self, trainer, pl_module)
             # Wait for all uploads to finish
-            get_model_manager().shutdown()
+            self._wait_for_background_tasks()
 
         def _remove_checkpoint(self, trainer: "pl.Trainer", filepath: str) -> None:
             """Extend the remove checkpoint method to remove the model from the registry."""
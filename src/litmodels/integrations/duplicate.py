@@ -1,6 +1,8 @@
 import os
 import shutil
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,54 @@ if module_available("huggingface_hub"):
 else:
     snapshot_download = None
 
+_HF_TRANSFER_AVAILABLE = module_available("hf_transfer")
+
+
+@contextmanager
+def _hf_fast_transfer() -> Iterator[None]:
+    """Switch Hugging Face Hub downloads within this context to its native parallel transfer backends.
+
+    The Hub reads `HF_HUB_ENABLE_HF_TRANSFER` once at import time, so setting the environment variable later has no
+    effect; the resolved constant is updated instead, and only if `hf_transfer` is installed as the Hub raises
+    otherwise. The Xet backend reads `HF_XET_HIGH_PERFORMANCE` when the transfer starts. Both are restored on exit,
+    so other downloads in the process are not affected.
+    """
+    from huggingface_hub import constants
+
+    hf_transfer = getattr(constants, "HF_HUB_ENABLE_HF_TRANSFER", None)
+    xet_high_performance = os.environ.get("HF_XET_HIGH_PERFORMANCE")
+    if _HF_TRANSFER_AVAILABLE and hf_transfer is not None:
+        constants.HF_HUB_ENABLE_HF_TRANSFER = True
+    if xet_high_performance is None:
+        os.environ["HF_XET_HIGH_PERFORMANCE"] = "1"
+    try:
+        yield
+    finally:
+        if hf_transfer is not None:
+            constants.HF_HUB_ENABLE_HF_TRANSFER = hf_transfer
+        if xet_high_performance is None:
+            os.environ.pop("HF_XET_HIGH_PERFORMANCE", None)
+
+
+def _purge_cache(root: str) -> None:
+    """Remove all `.cache*` entries below `root` without descending into them.
+
+    Args:
+        root: Directory to clean up.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if entry.name.startswith(".cache"):
+                    if is_dir:
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+                elif is_dir:
+                    stack.append(entry.path)
+
 
 def duplicate_hf_model(
     hf_model: str,
@@ -43,20 +93,19 @@ def duplicate_hf_model(
     local_workdir = Path(local_workdir)
     model_name = hf_model.replace("/", "_")
 
-    os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
     # Download the model from Hugging Face
-    snapshot_download(
-        repo_id=hf_model,
-        revision="main",  # Branch/tag/commit
-        repo_type="model",  # Options: "dataset", "model", "space"
-        local_dir=local_workdir / model_name,  # Specify to save in custom location, default is cache
-        local_dir_use_symlinks=True,  # Use symlinks to save disk space
-        ignore_patterns=[".cache*"],  # Exclude certain files if needed
-        max_workers=os.cpu_count(),  # Number of parallel downloads
-    )
+    with _hf_fast_transfer():
+        snapshot_download(
+            repo_id=hf_model,
+            revision="main",  # Branch/tag/commit
+            repo_type="model",  # Options: "dataset", "model", "space"
+            local_dir=local_workdir / model_name,  # Specify to save in custom location, default is cache
+            local_dir_use_symlinks=True,  # Use symlinks to save disk space
+            ignore_patterns=[".cache*"],  # Exclude certain files if needed
+            max_workers=os.cpu_count(),  # Number of parallel downloads
+        )
     # prune cache in the downloaded model
-    for path in local_workdir.rglob(".cache*"):
-        shutil.rmtree(path)
+    _purge_cache(str(local_workdir))
 
     # Upload the model to Lightning Cloud
     if not lit_model:
@@ -1,6 +1,6 @@
 """Root package for Input/output."""
 
 from litmodels.io.cloud import download_model_files, upload_model_files  # noqa: F401
-from litmodels.io.gateway import download_model, load_model, save_model, upload_model
+from litmodels.io.gateway import download_model, load_model, register_serializer, save_model, upload_model
 
-__all__ = ["download_model", "upload_model", "upload_model_files", "load_model", "save_model"]
+__all__ = ["download_model", "upload_model", "upload_model_files", "load_model", "save_model", "register_serializer"]
@@ -2,6 +2,9 @@
 # Licensed under the Apache License, Version 2.0 (the "License");
 #     http://www.apache.org/licenses/LICENSE-2.0
 #
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -12,12 +15,21 @@ from lightning_sdk.models import download_model as sdk_download_model
 from lightning_sdk.models import upload_model as sdk_upload_model
 
 import litmodels
+from litmodels.io.utils import (
+    _COMPRESSED_SUFFIX,
+    _COMPRESSION_MIN_SIZE,
+    _ZSTANDARD_AVAILABLE,
+    _compress_zstd,
+    _decompress_zstd,
+)
 
 if TYPE_CHECKING:
     from lightning_sdk.models import UploadedModelInfo
 
 
-_SHOWED_MODEL_LINKS = []
+_SHOWED_MODEL_LINKS: set[str] = set()
+# maximal number of organizations resolved concurrently when listing teamspaces
+_ORG_LOOKUP_WORKERS = 16
 
 
 def _print_model_link(name: str, verbose: Union[bool, int]) -> None:
@@ -30,6 +42,8 @@ def _print_model_link(name: str, verbose: Union[bool, int]) -> None:
             - 1: print the link only once for a given model
             - 2: always print the link
     """
+    if not verbose:
+        return
     name = _extend_model_name_with_teamspace(name)
     org_name, teamspace_name, model_name, _ = _parse_org_teamspace_model_version(name)
 
@@ -39,7 +53,20 @@ def _print_model_link(name: str, verbose: Union[bool, int]) -> None:
         print(msg)
     elif url not in _SHOWED_MODEL_LINKS:
         print(msg)
-        _SHOWED_MODEL_LINKS.append(url)
+        _SHOWED_MODEL_LINKS.add(url)
+
+
+def _check_compression(compression: Optional[str]) -> None:
+    """Validate the requested upload compression.
+
+    Raises:
+        ValueError: If the compression is not supported.
+        ModuleNotFoundError: If the compression is requested but `zstandard` is not installed.
+    """
+    if compression not in (None, "zstd"):
+        raise ValueError(f"Unsupported compression '{compression}', only 'zstd' is supported.")
+    if compression and not _ZSTANDARD_AVAILABLE:
+        raise ModuleNotFoundError("Compression requires `zstandard`. Please install it with `pip install zstandard`.")
 
 
 def upload_model_files(
@@ -49,6 +76,7 @@ def upload_model_files(
     cloud_account: Optional[str] = None,
     verbose: Union[bool, int] = 1,
     metadata: Optional[dict[str, str]] = None,
+    compression: Optional[str] = None,
 ) -> "UploadedModelInfo":
     """Upload local artifact(s) to Lightning Cloud using the SDK.
 
@@ -59,23 +87,40 @@ def upload_model_files(
         cloud_account: Optional cloud account to store the model in, when it cannot be auto-resolved.
         verbose: Verbosity for printing the model link (0 = no output, 1 = print once, 2 = print always).
         metadata: Optional metadata to attach to the model/version. The package version is added automatically.
+        compression: Optional compression applied before uploading, only 'zstd' is supported (requires the
+            `zstandard` package). Only a single file larger than 64 MiB is compressed; it is uploaded with the
+            '.litmodels.zst' suffix and decompressed again by `download_model_files`.
 
     Returns:
         UploadedModelInfo describing the created or updated model version.
+
+    Raises:
+        ValueError: If the compression is not supported.
+        ModuleNotFoundError: If the compression is requested but `zstandard` is not installed.
     """
+    _check_compression(compression)
     resolved_name = _extend_model_name_with_teamspace(name)
     _parse_org_teamspace_model_version(resolved_name)
 
     if not metadata:
         metadata = {}
     metadata.update({"litModels": litmodels.__version__})
-    info = sdk_upload_model(
-        name=resolved_name,
-        path=path,
-        progress_bar=progress_bar,
-        cloud_account=cloud_account,
-        metadata=metadata,
-    )
+    compressed_path = None
+    file_path = path if isinstance(path, (str, Path)) and os.path.isfile(path) else None
+    if compression and file_path and os.path.getsize(file_path) > _COMPRESSION_MIN_SIZE:
+        path = compressed_path = _compress_zstd(file_path)
+        metadata.update({"litModels.compression": compression})
+    try:
+        info = sdk_upload_model(
+            name=resolved_name,
+            path=path,
+            progress_bar=progress_bar,
+            cloud_account=cloud_account,
+            metadata=metadata,
+        )
+    finally:
+        if compressed_path:
+            os.remove(compressed_path)
     if verbose:
         _print_model_link(resolved_name, verbose)
     return info
@@ -94,21 +139,41 @@ def download_model_files(
         progress_bar: Whether to show a progress bar during download.
 
     Returns:
-        str | list[str]: Absolute path(s) to the downloaded artifact(s).
+        str | list[str]: Absolute path(s) to the downloaded artifact(s). Files compressed on upload are
+        decompressed and reported without the '.litmodels.zst' suffix.
+
+    Raises:
+        ModuleNotFoundError: If the model contains files compressed on upload but `zstandard` is not installed.
     """
     resolved_name = _extend_model_name_with_teamspace(name)
     _parse_org_teamspace_model_version(resolved_name)
 
-    return sdk_download_model(
+    paths = sdk_download_model(
         name=resolved_name,
         download_dir=download_dir,
         progress_bar=progress_bar,
     )
-
-
+    if isinstance(paths, str):
+        return paths
+    for i, path in enumerate(paths):
+        if not path.endswith(_COMPRESSED_SUFFIX):
+            continue
+        if not _ZSTANDARD_AVAILABLE:
+            raise ModuleNotFoundError(
+                f"The model file '{path}' was compressed on upload and requires `zstandard` to decompress."
+                " Please install it with `pip install zstandard`."
+            )
+        _decompress_zstd(os.path.join(download_dir, path))
+        paths[i] = path[: -len(_COMPRESSED_SUFFIX)]
+    return paths
+
+
+@cache
 def _list_available_teamspaces() -> dict[str, dict]:
     """List teamspaces available to the authenticated user.
 
+    The result is cached for the lifetime of the process as it requires several requests to the cloud.
+
     Returns:
         dict[str, dict]: Mapping of 'org/teamspace' to a metadata dictionary with details.
     """
@@ -117,10 +182,18 @@ def _list_available_teamspaces() -> dict[str, dict]:
 
     org_api = OrgApi()
     user = sdk_resolvers._get_authed_user()
+    memberships = list(UserApi()._get_all_teamspace_memberships(""))
+    # resolve each organization only once and concurrently, a user typically has several teamspaces in the same one
+    org_ids = list(dict.fromkeys(ts.owner_id for ts in memberships if ts.owner_type == "organization"))
+    if len(org_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(org_ids), _ORG_LOOKUP_WORKERS)) as executor:
+            orgs = dict(zip(org_ids, executor.map(org_api._get_org_by_id, org_ids)))
+    else:
+        orgs = {org_id: org_api._get_org_by_id(org_id) for org_id in org_ids}
     teamspaces = {}
-    for ts in UserApi()._get_all_teamspace_memberships(""):
+    for ts in memberships:
         if ts.owner_type == "organization":
-            org = org_api._get_org_by_id(ts.owner_id)
+            org = orgs[ts.owner_id]
             teamspaces[f"{org.name}/{ts.name}"] = {"name": ts.name, "org": org.name}
         elif ts.owner_type == "user":  # todo: check also the name
             teamspaces[f"{user.name}/{ts.name}"] = {"name": ts.name, "user": user}
@@ -1,20 +1,193 @@
+import atexit
+import hashlib
+import json
 import os
+import shutil
+import stat
+import sys
 import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, overload
+
+from lightning_sdk.models import _extend_model_name_with_teamspace, _parse_org_teamspace_model_version
 
 from litmodels.io.cloud import download_model_files, upload_model_files
-from litmodels.io.utils import _KERAS_AVAILABLE, _PYTORCH_AVAILABLE, dump_pickle, load_pickle
+from litmodels.io.utils import (
+    _PYTORCH_AVAILABLE,
+    _SAFETENSORS_AVAILABLE,
+    _keras_available,
+    dump_pickle,
+    load_pickle,
+)
 
 if _PYTORCH_AVAILABLE:
     import torch
 
-if _KERAS_AVAILABLE:
-    from tensorflow import keras
+if _SAFETENSORS_AVAILABLE:
+    import safetensors.torch
 
 if TYPE_CHECKING:
     from lightning_sdk.models import UploadedModelInfo
 
+# staging folders kept for reuse by `save_model`, keyed by model class name, the least recently used is evicted first
+_STAGING_POOL: "OrderedDict[str, str]" = OrderedDict()
+_STAGING_POOL_SIZE = 8
+_STAGING_POOL_LOCK = threading.Lock()
+# background serialization and upload for `save_model(..., blocking=False)`
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="litmodels-save")
+_CACHE_MANIFEST = "manifest.json"
+# integration marker added to the metadata of every `save_model` upload
+_SAVE_MODEL_METADATA = MappingProxyType({"litModels.integration": "save_model"})
+# documentation files shipped alongside a model, skipped by `load_model`
+_DOC_SUFFIXES = (".md", ".txt", ".rst")
+
+
+def _is_keras_model_class(cls: type) -> bool:
+    """Check whether the class is a Keras model, without importing Keras or TensorFlow if they were not imported yet.
+
+    Both the standalone ``keras`` package and the Keras bundled with TensorFlow are recognized.
+    """
+    keras_model = getattr(sys.modules.get("keras"), "Model", None)
+    if isinstance(keras_model, type) and issubclass(cls, keras_model):
+        return True
+    if "tensorflow" not in sys.modules or not _keras_available():
+        return False
+    from tensorflow import keras
+
+    return issubclass(cls, keras.models.Model)
+
+
+def _load_keras(path: str) -> Any:
+    """Load a Keras model, importing TensorFlow only when needed."""
+    if not _keras_available():
+        raise ModuleNotFoundError("Loading a Keras model requires `tensorflow`. Please install it.")
+    from tensorflow import keras
+
+    return keras.models.load_model(path)
+
+
+# loaders used by `load_model`, keyed by the lowercase file extension
+_LOADERS: dict[str, Callable[[str], Any]] = {".pkl": load_pickle, ".keras": _load_keras}
+if _PYTORCH_AVAILABLE:
+    _LOADERS[".ts"] = torch.jit.load
+    _LOADERS[".pth"] = partial(torch.load, map_location="cpu", weights_only=True)
+if _SAFETENSORS_AVAILABLE:
+    _LOADERS[".safetensors"] = partial(safetensors.torch.load_file, device="cpu")
+
+
+def _download_cache_dir() -> Path:
+    """Root of the local download cache, `LITMODELS_CACHE_DIR` or `litmodels` in the user cache directory."""
+    if os.environ.get("LITMODELS_CACHE_DIR"):
+        return Path(os.environ["LITMODELS_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "litmodels"
+
+
+def _make_read_only(folder: Path) -> None:
+    """Remove the write permissions of all files in a cache entry, which are shared with downloads by hard links."""
+    for path in folder.rglob("*"):
+        if path.is_file():
+            path.chmod(stat.S_IMODE(path.stat().st_mode) & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link a cached file into place, copying it if linking is not possible, e.g. across filesystems.
+
+    A linked file shares its content with the cache entry, it is read-only so that it cannot be modified in place.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _cached_download(name: str, download_dir: Union[str, Path], progress_bar: bool) -> Union[str, list[str]]:
+    """Download a model version through the local cache, keyed by the fully resolved registry name.
+
+    Only names with an explicit version are cached, the latest version of a model changes with every upload.
+    """
+    resolved_name = _extend_model_name_with_teamspace(name)
+    *_, version = _parse_org_teamspace_model_version(resolved_name)
+    if not version:
+        return download_model_files(name=name, download_dir=download_dir, progress_bar=progress_bar)
+
+    cache_root = _download_cache_dir()
+    entry = cache_root / hashlib.sha256(resolved_name.encode()).hexdigest()
+    if not (entry / _CACHE_MANIFEST).is_file():
+        cache_root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=cache_root, prefix=".download-"))
+        try:
+            paths = download_model_files(name=name, download_dir=staging, progress_bar=progress_bar)
+            with open(staging / _CACHE_MANIFEST, "w") as fp:
+                json.dump({"name": resolved_name, "paths": paths}, fp)
+            _make_read_only(staging)
+            # publish the complete entry atomically, a concurrent download may have been faster
+            os.rename(staging, entry)
+        except OSError:
+            if not (entry / _CACHE_MANIFEST).is_file():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    with open(entry / _CACHE_MANIFEST) as fp:
+        paths = json.load(fp)["paths"]
+    for path in [paths] if isinstance(paths, str) else paths:
+        _link_or_copy(entry / path, Path(download_dir) / path)
+    return paths
+
+
+@contextmanager
+def _pooled_staging_dir(key: str) -> Iterator[str]:
+    """Borrow a staging folder from the process-wide pool, creating one if none is free for the given key.
+
+    Args:
+        key: Pool key, typically the model class name, so a model is always serialized into the same folder.
+
+    Yields:
+        Path to a staging folder used exclusively by the caller until the context exits.
+    """
+    with _STAGING_POOL_LOCK:
+        staging_dir = _STAGING_POOL.pop(key, None)
+    if staging_dir is None:
+        staging_dir = tempfile.mkdtemp(prefix="litmodels-")
+    try:
+        yield staging_dir
+    finally:
+        with _STAGING_POOL_LOCK:
+            evicted = [_STAGING_POOL.pop(key)] if key in _STAGING_POOL else []
+            _STAGING_POOL[key] = staging_dir
+            while len(_STAGING_POOL) > _STAGING_POOL_SIZE:
+                evicted.append(_STAGING_POOL.popitem(last=False)[1])
+        for folder in evicted:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+def _remove_path(path: str) -> None:
+    """Remove a file or folder if it exists."""
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+@atexit.register
+def _cleanup_staging_pool() -> None:
+    """Remove all pooled staging folders at interpreter exit."""
+    with _STAGING_POOL_LOCK:
+        folders = list(_STAGING_POOL.values())
+        _STAGING_POOL.clear()
+    for folder in folders:
+        shutil.rmtree(folder, ignore_errors=True)
+
 
 def upload_model(
     name: str,
@@ -23,6 +196,7 @@ def upload_model(
     cloud_account: Optional[str] = None,
     verbose: Union[bool, int] = 1,
     metadata: Optional[dict[str, str]] = None,
+    compression: Optional[str] = None,
 ) -> "UploadedModelInfo":
     """Upload a local artifact (file or directory) to Lightning Cloud Models.
 
@@ -34,6 +208,7 @@ def upload_model(
         cloud_account: Optional cloud account to store the model in, when it cannot be auto-resolved.
         verbose: Verbosity of informational output (0 = silent, 1 = print link once, 2 = print link always).
         metadata: Optional metadata key/value pairs to attach to the uploaded model/version.
+        compression: Optional compression of a large checkpoint file before upload, only 'zstd' is supported.
 
     Returns:
         UploadedModelInfo describing the created or updated model version.
@@ -54,9 +229,205 @@ def upload_model(
         cloud_account=cloud_account,
         verbose=verbose,
         metadata=metadata,
+        compression=compression,
     )
 
 
+def _is_safetensors_compatible(state_dict: dict[str, Any]) -> bool:
+    """Check whether a state dict can be written with safetensors.
+
+    Safetensors stores only dense, contiguous tensors and rejects tensors sharing memory, such as tied weights.
+    """
+    storages = set()
+    for v in state_dict.values():
+        if not isinstance(v, torch.Tensor) or v.layout != torch.strided or not v.is_contiguous():
+            return False
+        storage = (v.device, v.untyped_storage().data_ptr())
+        if storage in storages:
+            return False
+        storages.add(storage)
+    return True
+
+
+def _copy_state_dict_to_host(state_dict: dict[str, Any]) -> dict[str, Any]:
+    """Copy the tensors of a state dict to host memory, overlapping all device-to-host transfers.
+
+    The copies from CUDA are issued without blocking and awaited once at the end, instead of one synchronization
+    per tensor. ``torch.save`` then writes the storages of the host tensors directly to the file.
+    """
+    devices = set()
+    host_state_dict = {}
+    for k, v in state_dict.items():
+        if isinstance(v, torch.Tensor):
+            if v.is_cuda:
+                devices.add(v.device)
+            v = v.detach().to("cpu", copy=True, non_blocking=v.is_cuda)
+        host_state_dict[k] = v
+    for device in devices:
+        torch.cuda.synchronize(device)
+    return host_state_dict
+
+
+# Serializers take the model, the destination path without extension and whether the call is blocking. They return
+# the path of the artifact and optionally a deferred write which finishes the serialization in the background.
+_Serializer = Callable[[Any, str, bool], tuple[str, Optional[Callable[[], None]]]]
+
+
+def _save_torchscript(model: "torch.jit.ScriptModule", stem: str, blocking: bool) -> tuple[str, None]:
+    path = f"{stem}.ts"
+    model.save(path)
+    return path, None
+
+
+def _save_torch_state_dict(
+    model: "torch.nn.Module",
+    stem: str,
+    blocking: bool,
+    dtype: Optional["torch.dtype"] = None,
+    use_safetensors: bool = False,
+) -> tuple[str, Callable[[], None]]:
+    state_dict = model.state_dict()
+    save_fn: Callable[..., Any]
+    if use_safetensors:
+        if not _is_safetensors_compatible(state_dict):
+            raise ValueError(
+                "The state dict cannot be saved with safetensors, it contains non-contiguous tensors or tensors"
+                " sharing memory such as tied weights. Save it without the `format` argument instead."
+            )
+        path = f"{stem}.safetensors"
+        save_fn = safetensors.torch.save_file
+    else:
+        path = f"{stem}.pth"
+        save_fn = torch.save
+    if dtype is not None:
+        state_dict = {
+            k: v.to(dtype) if isinstance(v, torch.Tensor) and v.is_floating_point() else v
+            for k, v in state_dict.items()
+        }
+    if not blocking:
+        # detach from the live parameters so they can keep changing while the copy is written
+        state_dict = _copy_state_dict_to_host(state_dict)
+    return path, partial(save_fn, state_dict, path)
+
+
+def _save_keras(model: Any, stem: str, blocking: bool) -> tuple[str, None]:
+    path = f"{stem}.keras"
+    model.save(path)
+    return path, None
+
+
+def _save_pickle(model: Any, stem: str, blocking: bool) -> tuple[str, None]:
+    path = f"{stem}.pkl"
+    dump_pickle(model=model, path=path)
+    return path, None
+
+
+# weight precisions supported by `save_model`, floating point tensors of the state dict are cast to them
+_PRECISIONS = ("bf16", "fp16")
+# optional file formats of the state dict of a PyTorch nn.Module, `torch.save` is used by default
+_FORMATS = ("safetensors",)
+
+
+# serializers registered per class, the most specific class in the MRO of a model wins
+_SERIALIZERS: dict[type, _Serializer] = {}
+# serializer resolved for each concrete model class seen so far
+_SERIALIZER_CACHE: dict[type, _Serializer] = {}
+if _PYTORCH_AVAILABLE:
+    _SERIALIZERS[torch.jit.ScriptModule] = _save_torchscript
+    _SERIALIZERS[torch.nn.Module] = _save_torch_state_dict
+
+
+def register_serializer(cls: type, extension: str, save_fn: Callable[[Any, str], None]) -> None:
+    """Register how `save_model` serializes instances of a class and its subclasses.
+
+    Args:
+        cls: The model class. The most specific registered class in the MRO of a model is used.
+        extension: File extension of the artifact, for example '.onnx'.
+        save_fn: Function called with the model and the destination file path.
+
+    Example:
+        >>> register_serializer(MyModel, ".bin", lambda model, path: model.export(path))  # doctest: +SKIP
+    """
+    if not extension.startswith("."):
+        extension = f".{extension}"
+
+    def _serializer(model: Any, stem: str, blocking: bool) -> tuple[str, None]:
+        path = f"{stem}{extension}"
+        save_fn(model, path)
+        return path, None
+
+    _SERIALIZERS[cls] = _serializer
+    _SERIALIZER_CACHE.clear()
+
+
+def _resolve_serializer(cls: type) -> _Serializer:
+    """Find the serializer for a model class by walking its MRO, and cache it unless it falls back to pickle."""
+    serializer = next((_SERIALIZERS[base] for base in cls.__mro__ if base in _SERIALIZERS), None)
+    if serializer is None:
+        if not _is_keras_model_class(cls):
+            # not cached, Keras may be imported later and the class may be a Keras model after all
+            return _save_pickle
+        serializer = _save_keras
+    _SERIALIZER_CACHE[cls] = serializer
+    return serializer
+
+
+def _write_and_upload(
+    cleanup: ExitStack, write: Optional[Callable[[], None]], **upload_kwargs: Any
+) -> "UploadedModelInfo":
+    """Finish a deferred serialization, upload the result and release the staging folder."""
+    with cleanup:
+        if write:
+            write()
+        return upload_model(**upload_kwargs)
+
+
+@overload
+def save_model(
+    name: str,
+    model: Union["torch.nn.Module", Any],
+    progress_bar: bool = ...,
+    cloud_account: Optional[str] = ...,
+    staging_dir: Optional[str] = ...,
+    verbose: Union[bool, int] = ...,
+    metadata: Optional[dict[str, str]] = ...,
+    blocking: Literal[True] = ...,
+    precision: Optional[str] = ...,
+    format: Optional[str] = ...,
+) -> "UploadedModelInfo": ...
+
+
+@overload
+def save_model(
+    name: str,
+    model: Union["torch.nn.Module", Any],
+    progress_bar: bool = ...,
+    cloud_account: Optional[str] = ...,
+    staging_dir: Optional[str] = ...,
+    verbose: Union[bool, int] = ...,
+    metadata: Optional[dict[str, str]] = ...,
+    *,
+    blocking: Literal[False],
+    precision: Optional[str] = ...,
+    format: Optional[str] = ...,
+) -> "Future[UploadedModelInfo]": ...
+
+
+@overload
+def save_model(
+    name: str,
+    model: Union["torch.nn.Module", Any],
+    progress_bar: bool = ...,
+    cloud_account: Optional[str] = ...,
+    staging_dir: Optional[str] = ...,
+    verbose: Union[bool, int] = ...,
+    metadata: Optional[dict[str, str]] = ...,
+    blocking: bool = ...,
+    precision: Optional[str] = ...,
+    format: Optional[str] = ...,
+) -> Union["UploadedModelInfo", "Future[UploadedModelInfo]"]: ...
+
+
 def save_model(
     name: str,
     model: Union["torch.nn.Module", Any],
@@ -65,13 +436,18 @@ def save_model(
     staging_dir: Optional[str] = None,
     verbose: Union[bool, int] = 1,
     metadata: Optional[dict[str, str]] = None,
-) -> "UploadedModelInfo":
+    blocking: bool = True,
+    precision: Optional[str] = None,
+    format: Optional[str] = None,
+) -> Union["UploadedModelInfo", "Future[UploadedModelInfo]"]:
     """Serialize an in-memory model and upload it to Lightning Cloud Models.
 
     Supported models:
         - TorchScript (torch.jit.ScriptModule) → saved as .ts via model.save()
-        - PyTorch nn.Module → saved as .pth (state_dict via torch.save)
+        - PyTorch nn.Module → saved as .pth (state_dict via torch.save), or .safetensors with
+          `format='safetensors'`
         - Keras (tf.keras.Model) → saved as .keras via model.save()
+        - Classes added with `register_serializer` → saved by the registered function
         - Any other Python object → saved as .pkl via pickle or joblib
 
     Args:
@@ -79,16 +455,29 @@ def save_model(
         model: The in-memory model instance to serialize and upload.
         progress_bar: Whether to show a progress bar during the upload.
         cloud_account: Optional cloud account to store the model in, when it cannot be auto-resolved.
-        staging_dir: Optional temporary directory used for serialization. A new temp directory is created if omitted.
+        staging_dir: Optional directory used for serialization, the serialized model is kept there. If omitted, a
+            temporary directory from a process-wide pool is reused per model class and removed at interpreter exit,
+            and the serialized model is removed right after the upload.
         verbose: Verbosity of informational output (0 = silent, 1 = print link once, 2 = print link always).
         metadata: Optional metadata key/value pairs to attach to the uploaded model/version. Integration markers are
             added automatically.
+        blocking: If False, return right after the model state is captured and upload in a background thread.
+            The weights of a PyTorch nn.Module are copied to host memory first so that training can continue,
+            other models are serialized before returning.
+        precision: Optional precision of the saved weights of a PyTorch nn.Module, 'bf16' or 'fp16'. Floating point
+            tensors of the state dict are cast before saving, which halves the size of float32 weights. The
+            precision is recorded in the metadata as 'litModels.precision'.
+        format: Optional file format of the state dict of a PyTorch nn.Module, 'safetensors' requires the
+            `safetensors` package and weights which do not share memory, e.g. no tied weights.
 
     Returns:
-        UploadedModelInfo describing the created or updated model version.
+        UploadedModelInfo describing the created or updated model version, or a Future resolving to it if
+        `blocking` is False.
 
     Raises:
         ValueError: If `model` is a path. For file/folder uploads use `upload_model()` instead.
+        ValueError: If `precision` or `format` is not supported or the model is not a PyTorch nn.Module.
+        ModuleNotFoundError: If `format` is 'safetensors' and `safetensors` is not installed.
     """
     if isinstance(model, (str, Path)):
         raise ValueError(
@@ -96,42 +485,60 @@ def save_model(
             " With file or folder path use `upload_model` instead."
         )
 
-    if not staging_dir:
-        staging_dir = tempfile.mkdtemp()
-    # if LightningModule and isinstance(model, LightningModule):
-    #     path = os.path.join(staging_dir, f"{model.__class__.__name__}.ckpt")
-    #     model.save_checkpoint(path)
-    if _PYTORCH_AVAILABLE and isinstance(model, torch.jit.ScriptModule):
-        path = os.path.join(staging_dir, f"{model.__class__.__name__}.ts")
-        model.save(path)
-    elif _PYTORCH_AVAILABLE and isinstance(model, torch.nn.Module):
-        path = os.path.join(staging_dir, f"{model.__class__.__name__}.pth")
-        torch.save(model.state_dict(), path)
-    elif _KERAS_AVAILABLE and isinstance(model, keras.models.Model):
-        path = os.path.join(staging_dir, f"{model.__class__.__name__}.keras")
-        model.save(path)
-    else:
-        path = os.path.join(staging_dir, f"{model.__class__.__name__}.pkl")
-        dump_pickle(model=model, path=path)
+    # a new dict, so the caller's metadata is not modified
+    metadata = {**metadata, **_SAVE_MODEL_METADATA} if metadata else dict(_SAVE_MODEL_METADATA)
 
-    if not metadata:
-        metadata = {}
-    metadata.update({"litModels.integration": "save_model"})
+    model_cls = type(model)
+    serializer = _SERIALIZER_CACHE.get(model_cls) or _resolve_serializer(model_cls)
+    state_dict_kwargs: dict[str, Any] = {}
+    if precision:
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}', expected one of {_PRECISIONS}.")
+        if serializer is not _save_torch_state_dict:
+            raise ValueError("The `precision` argument is only supported for PyTorch nn.Module models.")
+        state_dict_kwargs["dtype"] = torch.bfloat16 if precision == "bf16" else torch.float16
+        metadata["litModels.precision"] = precision
+    if format:
+        if format not in _FORMATS:
+            raise ValueError(f"Unsupported format '{format}', expected one of {_FORMATS}.")
+        if serializer is not _save_torch_state_dict:
+            raise ValueError("The `format` argument is only supported for PyTorch nn.Module models.")
+        if not _SAFETENSORS_AVAILABLE:
+            raise ModuleNotFoundError("Saving with `format='safetensors'` requires `safetensors`. Please install it.")
+        state_dict_kwargs["use_safetensors"] = True
+    if state_dict_kwargs:
+        serializer = partial(_save_torch_state_dict, **state_dict_kwargs)
 
-    return upload_model(
-        model=path,
-        name=name,
-        progress_bar=progress_bar,
-        cloud_account=cloud_account,
-        verbose=verbose,
-        metadata=metadata,
-    )
+    with ExitStack() as cleanup:
+        pooled = not staging_dir
+        folder = staging_dir or cleanup.enter_context(_pooled_staging_dir(model_cls.__name__))
+        # if LightningModule and isinstance(model, LightningModule):
+        #     path = os.path.join(folder, f"{model.__class__.__name__}.ckpt")
+        #     model.save_checkpoint(path)
+        path, write = serializer(model, os.path.join(folder, model_cls.__name__), blocking)
+
+        if pooled:
+            # free the space taken by the serialized model once uploaded, only the empty folder stays pooled
+            cleanup.callback(_remove_path, path)
+        upload_kwargs = {
+            "model": path,
+            "name": name,
+            "progress_bar": progress_bar,
+            "cloud_account": cloud_account,
+            "verbose": verbose,
+            "metadata": metadata,
+        }
+        if not blocking:
+            # hand the staging folder over to the background task
+            return _SAVE_POOL.submit(_write_and_upload, cleanup.pop_all(), write, **upload_kwargs)
+        return _write_and_upload(ExitStack(), write, **upload_kwargs)
 
 
 def download_model(
     name: str,
     download_dir: Union[str, Path] = ".",
     progress_bar: bool = True,
+    use_cache: bool = False,
 ) -> Union[str, list[str]]:
     """Download a model version from Lightning Cloud Models to a local directory.
 
@@ -139,10 +546,16 @@ def download_model(
         name: Model registry name in the form 'organization/teamspace/modelname[:version]'.
         download_dir: Directory where the artifact(s) will be stored. Defaults to the current working directory.
         progress_bar: Whether to show a progress bar during the download.
+        use_cache: If True and the name includes a version, download it only once into the local cache
+            (``LITMODELS_CACHE_DIR`` or ``~/.cache/litmodels``) and link the files from there into `download_dir`.
+            The linked files are read-only, as writing to them would modify the cache; replace or copy them to
+            make changes. Do not use it for versions which get overwritten, such as the 'last' checkpoint.
 
     Returns:
         str | list[str]: Absolute path(s) to the downloaded file(s) or directory content.
     """
+    if use_cache:
+        return _cached_download(name=name, download_dir=download_dir, progress_bar=progress_bar)
     return download_model_files(
         name=name,
         download_dir=download_dir,
@@ -150,17 +563,20 @@ def download_model(
     )
 
 
-def load_model(name: str, download_dir: str = ".") -> Any:
+def load_model(name: str, download_dir: str = ".", use_cache: bool = False) -> Any:
     """Download a model and load it into memory based on its file extension.
 
     Supported formats:
         - .ts → torch.jit.load
+        - .pth → state dict via torch.load
+        - .safetensors → state dict via safetensors.torch.load_file
         - .keras → keras.models.load_model
         - .pkl → pickle/joblib via load_pickle
 
     Args:
         name: Model registry name in the form 'organization/teamspace/modelname[:version]'.
         download_dir: Directory to store the downloaded artifact(s) before loading. Defaults to the current directory.
+        use_cache: If True, reuse a versioned model from the local download cache, see `download_model`.
 
     Returns:
         Any: The loaded model object.
@@ -168,16 +584,15 @@ def load_model(name: str, download_dir: str = ".") -> Any:
     Raises:
         NotImplementedError: If multiple files are downloaded or the file extension is not supported.
     """
-    download_paths = download_model(name=name, download_dir=download_dir)
+    download_paths = download_model(name=name, download_dir=download_dir, use_cache=use_cache)
     # filter out all Markdown, TXT and RST files
-    download_paths = [p for p in download_paths if Path(p).suffix.lower() not in {".md", ".txt", ".rst"}]
+    download_paths = [p for p in download_paths if not p.lower().endswith(_DOC_SUFFIXES)]
     if len(download_paths) > 1:
         raise NotImplementedError("Downloaded model with multiple files is not supported yet.")
-    model_path = Path(download_dir) / download_paths[0]
-    if model_path.suffix.lower() == ".ts":
-        return torch.jit.load(model_path)
-    if model_path.suffix.lower() == ".keras":
-        return keras.models.load_model(model_path)
-    if model_path.suffix.lower() == ".pkl":
-        return load_pickle(path=model_path)
-    raise NotImplementedError(f"Loading model from {model_path.suffix} is not supported yet.")
+    # the downloaded paths are relative to the download folder, an absolute path is kept as is by the join
+    model_path = os.path.join(download_dir, download_paths[0])
+    suffix = os.path.splitext(model_path)[1]
+    loader = _LOADERS.get(suffix.lower())
+    if loader is None:
+        raise NotImplementedError(f"Loading model from {suffix} is not supported yet.")
+    return loader(model_path)
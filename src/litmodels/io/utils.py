@@ -1,7 +1,10 @@
+import importlib.util
+import mmap
 import os
 import pickle
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 from typing import Any, Union
 
@@ -24,34 +27,69 @@ def _suppress_os_stderr() -> Iterator[None]:
 
 _JOBLIB_AVAILABLE = module_available("joblib")
 _PYTORCH_AVAILABLE = module_available("torch")
-with _suppress_os_stderr():
-    _TENSORFLOW_AVAILABLE = module_available("tensorflow")
-    _KERAS_AVAILABLE = RequirementCache("tensorflow >=2.0.0")
+_SAFETENSORS_AVAILABLE = module_available("safetensors")
+_ZSTANDARD_AVAILABLE = module_available("zstandard")
+
+
+@cache
+def _keras_available() -> bool:
+    """Check once per process whether TensorFlow with Keras is installed, silencing its native logging."""
+    if importlib.util.find_spec("tensorflow") is None:
+        return False
+    with _suppress_os_stderr():
+        return bool(RequirementCache("tensorflow >=2.0.0"))
+
 
 if _JOBLIB_AVAILABLE:
     import joblib
 
+if _PYTORCH_AVAILABLE:
+    import torch
+
+if _ZSTANDARD_AVAILABLE:
+    import zstandard
 
-def dump_pickle(model: Any, path: Union[str, Path]) -> None:
-    """Serialize a Python object to disk using joblib (if available) or pickle.
+# files smaller than this are not worth compressing before upload
+_COMPRESSION_MIN_SIZE = 64 * 1024 * 1024
+_COMPRESSION_CHUNK_SIZE = 4 * 1024 * 1024
+# suffix of files compressed by litmodels, distinct from '.zst' so user artifacts are never decompressed
+_COMPRESSED_SUFFIX = ".litmodels.zst"
+_ZIP_MAGIC = b"PK\x03\x04"
+# zlib ships with Python, so any consumer can load the artifact; a low level keeps dumps fast
+_JOBLIB_COMPRESS = 3
+
+
+def dump_pickle(model: Any, path: Union[str, Path], compress: Union[int, tuple[str, int]] = _JOBLIB_COMPRESS) -> None:
+    """Serialize a Python object to disk using torch, joblib (if available) or pickle.
 
     Args:
         model: The object to serialize.
         path: Destination file path.
+        compress: Compression passed to joblib, defaults to zlib level 3. A faster codec like ``("lz4", 3)`` is
+            opt-in, as every consumer of the artifact then needs the codec's package installed to load it.
 
     Notes:
-        - Uses joblib with compression (level 7) when available for smaller artifacts.
+        - PyTorch tensors and modules are written with `torch.save`, which stores tensor data without compression.
+        - Uses joblib with compression when available for smaller artifacts.
         - Falls back to pickle with the highest protocol otherwise.
     """
-    if _JOBLIB_AVAILABLE:
-        joblib.dump(model, filename=path, compress=7)
+    if _PYTORCH_AVAILABLE and isinstance(model, (torch.Tensor, torch.nn.Module)):
+        torch.save(model, path)
+    elif _JOBLIB_AVAILABLE:
+        joblib.dump(model, filename=path, compress=compress)
     else:
         with open(path, "wb") as fp:
             pickle.dump(model, fp, protocol=pickle.HIGHEST_PROTOCOL)
 
 
+def _is_torch_archive(path: Union[str, Path]) -> bool:
+    """Check whether the file is a zip archive as written by `torch.save`, joblib and pickle files never are."""
+    with open(path, "rb") as fp:
+        return fp.read(4) == _ZIP_MAGIC
+
+
 def load_pickle(path: Union[str, Path]) -> Any:
-    """Load a Python object from a joblib/pickle file.
+    """Load a Python object from a torch/joblib/pickle file.
 
     Args:
         path: Path to the serialized artifact.
@@ -62,7 +100,46 @@ def load_pickle(path: Union[str, Path]) -> Any:
     Warning:
         Loading pickle/joblib files can execute arbitrary code. Only open files from trusted sources.
     """
+    if _PYTORCH_AVAILABLE and _is_torch_archive(path):
+        return torch.load(path, weights_only=False)
     if _JOBLIB_AVAILABLE:
         return joblib.load(path)
-    with open(path, "rb") as fp:
-        return pickle.load(fp)
+    # unpickle straight from the page cache instead of reading the file through a userspace buffer
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pickle.loads(mm)
+
+
+def _compress_zstd(path: Union[str, Path], level: int = 3) -> str:
+    """Stream-compress a file with zstd next to the original, using all available cores.
+
+    Args:
+        path: Path to the file to compress.
+        level: Compression level.
+
+    Returns:
+        str: Path to the compressed file, the original path with the '.litmodels.zst' suffix appended.
+    """
+    compressed_path = f"{path}{_COMPRESSED_SUFFIX}"
+    compressor = zstandard.ZstdCompressor(level=level, threads=-1)
+    with open(path, "rb") as src, open(compressed_path, "wb") as dst:
+        compressor.copy_stream(src, dst, read_size=_COMPRESSION_CHUNK_SIZE, write_size=_COMPRESSION_CHUNK_SIZE)
+    return compressed_path
+
+
+def _decompress_zstd(path: Union[str, Path]) -> str:
+    """Stream-decompress a '.litmodels.zst' file next to it and remove the compressed file.
+
+    Args:
+        path: Path to the compressed file.
+
+    Returns:
+        str: Path to the decompressed file, the original path without the '.litmodels.zst' suffix.
+    """
+    path = str(path)
+    decompressed_path = path[: -len(_COMPRESSED_SUFFIX)]
+    with open(path, "rb") as src, open(decompressed_path, "wb") as dst:
+        zstandard.ZstdDecompressor().copy_stream(
+            src, dst, read_size=_COMPRESSION_CHUNK_SIZE, write_size=_COMPRESSION_CHUNK_SIZE
+        )
+    os.remove(path)
+    return decompressed_path
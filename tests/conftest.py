@@ -2,11 +2,14 @@
 
 import pytest
 
-from litmodels.integrations.checkpoints import get_model_manager
+from litmodels.integrations.checkpoints import _authenticate, get_model_manager
+from litmodels.io.cloud import _list_available_teamspaces
 
 
 @pytest.fixture(autouse=True)
 def reset_model_manager():
+    _authenticate.cache_clear()
+    _list_available_teamspaces.cache_clear()
     get_model_manager.cache_clear()
     # Optionally, call it once to initialize immediately
     return get_model_manager()
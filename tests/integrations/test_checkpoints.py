@@ -1,3 +1,4 @@
+import os
 import pickle
 import re
 from unittest import mock
@@ -20,6 +21,7 @@ from tests.integrations import _SKIP_IF_LIGHTNING_MISSING, _SKIP_IF_PYTORCHLIGHT
 )
 @pytest.mark.parametrize("clear_all_local", [True, False])
 @pytest.mark.parametrize("keep_all_uploaded", [True, False])
+@pytest.mark.parametrize("background_save", [False, True])
 @mock.patch("litmodels.io.cloud.sdk_delete_model")
 @mock.patch("litmodels.io.cloud.sdk_upload_model")
 @mock.patch("litmodels.integrations.checkpoints.Auth")
@@ -32,25 +34,31 @@ def test_lightning_checkpoint_callback(
     model_name,
     clear_all_local,
     keep_all_uploaded,
+    background_save,
     tmp_path,
 ):
     if importing == "lightning":
-        from lightning.pytorch import Trainer
+        from lightning.pytorch import Trainer, seed_everything
         from lightning.pytorch.callbacks import ModelCheckpoint
         from lightning.pytorch.demos.boring_classes import BoringModel
 
         from litmodels.integrations.checkpoints import LightningModelCheckpoint as LitModelCheckpoint
     elif importing == "pytorch_lightning":
-        from pytorch_lightning import Trainer
+        from pytorch_lightning import Trainer, seed_everything
         from pytorch_lightning.callbacks import ModelCheckpoint
         from pytorch_lightning.demos.boring_classes import BoringModel
 
         from litmodels.integrations.checkpoints import PytorchLightningModelCheckpoint as LitModelCheckpoint
+    from litmodels.integrations.checkpoints import ModelManager
 
     # Validate inheritance
     assert issubclass(LitModelCheckpoint, ModelCheckpoint)
 
-    ckpt_args = {"clear_all_local": clear_all_local, "keep_all_uploaded": keep_all_uploaded}
+    ckpt_args = {
+        "clear_all_local": clear_all_local,
+        "keep_all_uploaded": keep_all_uploaded,
+        "background_save": background_save,
+    }
     if model_name:
         ckpt_args.update({"model_registry": model_name})
 
@@ -95,7 +103,11 @@ def test_lightning_checkpoint_callback(
         callbacks=LitModelCheckpoint(**ckpt_args),
     )
     trainer.strategy.remove_checkpoint = mock_remove_ckpt
-    trainer.fit(BoringModel())
+    seed_everything(0)
+    with mock.patch.object(ModelManager, "queue_save", autospec=True, side_effect=ModelManager.queue_save) as mock_save:
+        trainer.fit(BoringModel())
+    # checkpoints are written by the background worker only if enabled
+    assert mock_save.call_count == (2 if background_save else 0)
 
     assert mock_auth.call_count == 1
     assert mock_upload_model.call_args_list == [
@@ -123,6 +135,26 @@ def test_lightning_checkpoint_callback(
         path = call_args[1]["path"]
         assert re.match(r".*[/\\]lightning_logs[/\\]version_\d+[/\\]checkpoints[/\\]epoch=\d+-step=\d+\.ckpt$", path)
 
+    if background_save:
+        import torch
+
+        # the checkpoints written in the background match the ones saved synchronously by the same training run
+        seed_everything(0)
+        Trainer(
+            max_epochs=2,
+            callbacks=ModelCheckpoint(dirpath=tmp_path / "sync", save_top_k=-1),
+            logger=False,
+            enable_progress_bar=False,
+            enable_model_summary=False,
+        ).fit(BoringModel())
+        for call_args in mock_upload_model.call_args_list:
+            path = call_args[1]["path"]
+            saved = torch.load(path, weights_only=False)
+            expected = torch.load(tmp_path / "sync" / os.path.basename(path), weights_only=False)
+            assert saved["global_step"] == expected["global_step"]
+            assert saved["state_dict"].keys() == expected["state_dict"].keys()
+            assert all(torch.equal(v, expected["state_dict"][k]) for k, v in saved["state_dict"].items())
+
 
 @pytest.mark.parametrize(
     "importing",
@@ -141,3 +173,241 @@ def test_lightning_checkpointing_pickleable(mock_auth, importing):
     ckpt = LitModelCheckpoint(model_registry="org-name/teamspace/model-name")
     assert mock_auth.call_count == 1
     pickle.dumps(ckpt)
+
+
+def test_checkpoint_snapshot_reuses_buffers():
+    import torch
+
+    from litmodels.integrations.checkpoints import _CheckpointSnapshot
+
+    weight = torch.ones(3, 2)
+    checkpoint = {"state_dict": {"weight": weight, "tied": weight}, "epoch": 1, "optimizer_states": [{"lr": 0.1}]}
+    snapshot = _CheckpointSnapshot()
+    copy = snapshot.take(checkpoint)
+    assert copy["epoch"] == 1
+    assert copy["optimizer_states"] == [{"lr": 0.1}]
+    # tied tensors keep sharing a single buffer
+    assert copy["state_dict"]["weight"] is copy["state_dict"]["tied"]
+    # later updates of the live tensors do not leak into the snapshot
+    weight.add_(1)
+    assert torch.equal(copy["state_dict"]["weight"], torch.ones(3, 2))
+    buffer = copy["state_dict"]["weight"]
+    snapshot.synchronize()
+    snapshot.release()
+
+    copy = snapshot.take(checkpoint)
+    assert copy["state_dict"]["weight"] is buffer
+    assert torch.equal(buffer, torch.full((3, 2), 2.0))
+    snapshot.release()
+    pickle.dumps(snapshot)
+
+
+def test_checkpoint_snapshot_released_on_failure(monkeypatch):
+    import torch
+
+    from litmodels.integrations.checkpoints import _CheckpointSnapshot
+
+    checkpoint = {"state_dict": {"weight": torch.ones(3, 2)}}
+    snapshot = _CheckpointSnapshot()
+    monkeypatch.setattr(torch, "empty", mock.Mock(side_effect=RuntimeError("out of memory")))
+    with pytest.raises(RuntimeError, match="out of memory"):
+        snapshot.take(checkpoint)
+    monkeypatch.undo()
+    # the failed snapshot does not block the next one
+    copy = snapshot.take(checkpoint)
+    assert torch.equal(copy["state_dict"]["weight"], torch.ones(3, 2))
+    snapshot.release()
+
+
+def test_model_manager_skips_superseded_uploads():
+    import threading
+
+    from litmodels.integrations.checkpoints import ModelManager
+
+    started, proceed = threading.Event(), threading.Event()
+
+    def _upload(name, model, metadata, compression):
+        started.set()
+        proceed.wait()
+
+    with mock.patch("litmodels.integrations.checkpoints.upload_model", side_effect=_upload) as mock_upload:
+        manager = ModelManager()
+        manager.queue_upload(registry_name="org/team/model:epoch=0", filepath="epoch=0.ckpt")
+        started.wait()
+        # while the first upload is running, the same version is queued twice
+        manager.queue_upload(registry_name="org/team/model:last", filepath="last.ckpt", metadata={"step": "1"})
+        manager.queue_upload(registry_name="org/team/model:last", filepath="last.ckpt", metadata={"step": "2"})
+        proceed.set()
+        manager.shutdown()
+
+    assert mock_upload.call_args_list == [
+        mock.call(name="org/team/model:epoch=0", model="epoch=0.ckpt", metadata=None, compression=None),
+        mock.call(name="org/team/model:last", model="last.ckpt", metadata={"step": "2"}, compression=None),
+    ]
+    assert manager.upload_count == 0
+
+
+@pytest.mark.parametrize(
+    "importing",
+    [
+        pytest.param("lightning", marks=_SKIP_IF_LIGHTNING_MISSING),
+        pytest.param("pytorch_lightning", marks=_SKIP_IF_PYTORCHLIGHTNING_MISSING),
+    ],
+)
+@mock.patch("litmodels.integrations.checkpoints.Auth")
+def test_lightning_checkpointing_authenticates_once(mock_auth, importing):
+    if importing == "lightning":
+        from litmodels.integrations.checkpoints import LightningModelCheckpoint as LitModelCheckpoint
+    elif importing == "pytorch_lightning":
+        from litmodels.integrations.checkpoints import PytorchLightningModelCheckpoint as LitModelCheckpoint
+
+    for _ in range(3):
+        LitModelCheckpoint(model_registry="org-name/teamspace/model-name")
+    assert mock_auth.call_count == 1
+    assert mock_auth.return_value.authenticate.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "importing",
+    [
+        pytest.param("lightning", marks=_SKIP_IF_LIGHTNING_MISSING),
+        pytest.param("pytorch_lightning", marks=_SKIP_IF_PYTORCHLIGHTNING_MISSING),
+    ],
+)
+@mock.patch("litmodels.integrations.checkpoints.Auth")
+def test_lightning_checkpointing_starts_shared_manager(mock_auth, importing):
+    if importing == "lightning":
+        from litmodels.integrations.checkpoints import LightningModelCheckpoint as LitModelCheckpoint
+    elif importing == "pytorch_lightning":
+        from litmodels.integrations.checkpoints import PytorchLightningModelCheckpoint as LitModelCheckpoint
+
+    from litmodels.integrations.checkpoints import get_model_manager
+
+    ckpt = LitModelCheckpoint(model_registry="org-name/teamspace/model-name")
+    assert ckpt._model_manager is get_model_manager()
+    assert ckpt._model_manager._worker.is_alive()
+
+
+def test_model_manager_bounded_queue(monkeypatch):
+    import threading
+
+    from litmodels.integrations.checkpoints import ModelManager
+
+    monkeypatch.setenv("LITMODELS_MAX_PENDING", "2")
+    assert ModelManager()._max_pending == 2
+
+    started, proceed = threading.Event(), threading.Event()
+
+    def _upload(name, model, metadata, compression):
+        started.set()
+        proceed.wait()
+
+    monkeypatch.setattr("litmodels.integrations.checkpoints._QUEUE_FULL_WARN_TIMEOUT", 0.01)
+    with mock.patch("litmodels.integrations.checkpoints.upload_model", side_effect=_upload) as mock_upload:
+        manager = ModelManager(max_pending=1)
+        manager.queue_upload(registry_name="org/team/model:epoch=0", filepath="epoch=0.ckpt")
+        started.wait()
+        manager.queue_upload(registry_name="org/team/model:epoch=1", filepath="epoch=1.ckpt")
+        # the queue is full while the first upload is running, so queuing warns and waits
+        threading.Timer(0.1, proceed.set).start()
+        with pytest.warns(UserWarning, match="The upload queue is full"):
+            manager.queue_upload(registry_name="org/team/model:epoch=2", filepath="epoch=2.ckpt")
+        manager.shutdown()
+
+    assert mock_upload.call_count == 3
+    assert manager.upload_count == 0
+
+
+def test_model_manager_bound_counts_only_latest_uploads(monkeypatch):
+    import threading
+    import warnings
+
+    from litmodels.integrations.checkpoints import ModelManager
+
+    started, proceed = threading.Event(), threading.Event()
+
+    def _upload(name, model, metadata, compression):
+        started.set()
+        proceed.wait()
+
+    monkeypatch.setattr("litmodels.integrations.checkpoints._QUEUE_FULL_WARN_TIMEOUT", 0.01)
+    # unblock the worker eventually, so a regression fails the test instead of hanging it
+    timer = threading.Timer(5, proceed.set)
+    timer.start()
+    with (
+        mock.patch("litmodels.integrations.checkpoints.upload_model", side_effect=_upload) as mock_upload,
+        warnings.catch_warnings(),
+    ):
+        warnings.simplefilter("error")
+        manager = ModelManager(max_pending=1)
+        manager.queue_upload(registry_name="org/team/model:epoch=0", filepath="epoch=0.ckpt")
+        started.wait()
+        manager.queue_upload(registry_name="org/team/model:last", filepath="last.ckpt")
+        # the bound is reached, but a newer upload to the same name supersedes the pending one instead of waiting
+        for _ in range(3):
+            manager.queue_upload(registry_name="org/team/model:last", filepath="last.ckpt")
+        # saves and removals are not bounded
+        manager.queue_remove(filepath="epoch=0.ckpt")
+        assert not proceed.is_set()
+        proceed.set()
+        manager.shutdown()
+    timer.cancel()
+
+    assert [c.kwargs["name"] for c in mock_upload.call_args_list] == ["org/team/model:epoch=0", "org/team/model:last"]
+    assert manager.upload_count == 0
+
+
+def test_model_manager_skips_identical_uploads(tmp_path):
+    from litmodels.integrations import checkpoints
+    from litmodels.integrations.checkpoints import ModelManager
+
+    checkpoint = tmp_path / "last.ckpt"
+    checkpoint.write_bytes(b"weights-1")
+    with (
+        mock.patch("litmodels.integrations.checkpoints.upload_model") as mock_upload,
+        mock.patch("litmodels.integrations.checkpoints._file_sha256", wraps=checkpoints._file_sha256) as mock_sha256,
+    ):
+        manager = ModelManager()
+        # the first upload of a name is not hashed, so the second one has nothing to compare with yet
+        for _ in range(2):
+            manager.queue_upload(registry_name="org/team/model:last", filepath=str(checkpoint))
+            manager.task_queue.join()
+        # unchanged content under the same name is not uploaded again
+        manager.queue_upload(registry_name="org/team/model:last", filepath=str(checkpoint))
+        manager.task_queue.join()
+        # unique versions are never hashed
+        manager.queue_upload(registry_name="org/team/model:epoch=0", filepath=str(checkpoint))
+        manager.task_queue.join()
+        assert mock_upload.call_count == 3
+        assert mock_sha256.call_count == 2
+        # a rewritten file of the same size and modification time is told apart by its content
+        mtime_ns = checkpoint.stat().st_mtime_ns
+        checkpoint.write_bytes(b"weights-2")
+        os.utime(checkpoint, ns=(mtime_ns, mtime_ns))
+        manager.queue_upload(registry_name="org/team/model:last", filepath=str(checkpoint))
+        manager.task_queue.join()
+        manager.queue_upload(registry_name="org/team/model:last", filepath=str(checkpoint))
+        manager.shutdown()
+
+    assert mock_upload.call_count == 4
+    assert mock_sha256.call_count == 4
+    assert manager.upload_count == 0
+
+
+@pytest.mark.filterwarnings("ignore:Upload failed")
+def test_model_manager_wait_all_reports_errors():
+    from litmodels.integrations.checkpoints import ModelManager
+
+    with mock.patch(
+        "litmodels.integrations.checkpoints.upload_model", side_effect=[RuntimeError("network down"), None]
+    ) as mock_upload:
+        manager = ModelManager()
+        manager.queue_upload(registry_name="org/team/model:epoch=0", filepath="epoch=0.ckpt")
+        errors = manager.wait_all()
+        assert [str(err) for err in errors] == ["network down"]
+        # the worker keeps running and the errors are reported only once
+        manager.queue_upload(registry_name="org/team/model:epoch=1", filepath="epoch=1.ckpt")
+        assert manager.wait_all() == []
+
+    assert mock_upload.call_count == 2
+    assert manager._worker.is_alive()
@@ -1,7 +1,9 @@
 import os
 from unittest import mock
 
-from litmodels.integrations.duplicate import duplicate_hf_model
+import pytest
+
+from litmodels.integrations.duplicate import _purge_cache, duplicate_hf_model
 
 
 @mock.patch("litmodels.integrations.duplicate.snapshot_download")
@@ -29,3 +31,41 @@ def test_duplicate_hf_model(mock_upload_model, mock_snapshot_download, tmp_path)
         metadata={"hf_model": hf_model, "litModels.integration": "duplicate_hf_model"},
         verbose=1,
     )
+
+
+@pytest.mark.parametrize("hf_transfer_available", [True, False])
+@mock.patch("litmodels.integrations.duplicate.snapshot_download")
+@mock.patch("litmodels.integrations.duplicate.upload_model_files")
+def test_duplicate_hf_model_fast_transfer_scoped(
+    mock_upload_model, mock_snapshot_download, hf_transfer_available, tmp_path, monkeypatch
+):
+    from huggingface_hub import constants
+
+    monkeypatch.setattr("litmodels.integrations.duplicate._HF_TRANSFER_AVAILABLE", hf_transfer_available)
+    monkeypatch.setattr(constants, "HF_HUB_ENABLE_HF_TRANSFER", False, raising=False)
+    monkeypatch.delenv("HF_XET_HIGH_PERFORMANCE", raising=False)
+    during_download = {}
+
+    def _snapshot_download(**kwargs):
+        during_download["hf_transfer"] = constants.HF_HUB_ENABLE_HF_TRANSFER
+        during_download["xet"] = os.environ.get("HF_XET_HIGH_PERFORMANCE")
+
+    mock_snapshot_download.side_effect = _snapshot_download
+    duplicate_hf_model(hf_model="google/t5-efficient-tiny", lit_model="model-name", local_workdir=str(tmp_path))
+
+    # the fast backends are enabled only for the download, and hf_transfer only if it is installed
+    assert during_download == {"hf_transfer": hf_transfer_available, "xet": "1"}
+    assert constants.HF_HUB_ENABLE_HF_TRANSFER is False
+    assert "HF_XET_HIGH_PERFORMANCE" not in os.environ
+
+
+def test_purge_cache(tmp_path):
+    (tmp_path / ".cache" / "huggingface").mkdir(parents=True)
+    (tmp_path / "subfolder" / ".cache_lock").mkdir(parents=True)
+    (tmp_path / "subfolder" / ".cache.json").write_text("{}")
+    (tmp_path / "subfolder" / "model.safetensors").write_text("weights")
+    (tmp_path / "config.json").write_text("{}")
+
+    _purge_cache(str(tmp_path))
+    remaining = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob("*"))
+    assert remaining == ["config.json", "subfolder", os.path.join("subfolder", "model.safetensors")]
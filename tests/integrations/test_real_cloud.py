@@ -15,7 +15,7 @@ from litmodels import download_model, load_model, save_model, upload_model
 from litmodels.integrations.duplicate import duplicate_hf_model
 from litmodels.integrations.mixins import PickleRegistryMixin, PyTorchRegistryMixin
 from litmodels.io.cloud import _list_available_teamspaces
-from litmodels.io.utils import _KERAS_AVAILABLE
+from litmodels.io.utils import _keras_available
 from tests.integrations import (
     _SKIP_IF_LIGHTNING_BELLOW_2_5_1,
     _SKIP_IF_PYTORCHLIGHTNING_BELLOW_2_5_1,
@@ -333,7 +333,7 @@ def test_list_available_teamspaces():
 
 @pytest.mark.cloud
 @pytest.mark.skipif(
-    not _KERAS_AVAILABLE,
+    not _keras_available(),
     reason="TensorFlow Keras is not supported on Windows for now.",
 )
 def test_save_load_tensorflow_keras(tmp_path):
@@ -1,102 +1,150 @@
+import io
 import os
+import pickle
+import re
+import sys
 from contextlib import nullcontext
+from functools import cache
+from pathlib import Path
+from typing import Any
 from unittest import mock
 
-import joblib
 import pytest
 import torch
 import torch.jit as torch_jit
-from sklearn import svm
 from torch.nn import Module
 
 import litmodels
 from litmodels import download_model, load_model, save_model
 from litmodels.io import upload_model_files
-from litmodels.io.utils import _KERAS_AVAILABLE
+from litmodels.io.utils import _SAFETENSORS_AVAILABLE, _ZSTANDARD_AVAILABLE, _keras_available
 from tests.integrations import LIT_TEAMSPACE, LIT_USER
 
+# error raised for model names which are not fully qualified outside a studio
+_NAME_ERROR_RE = re.compile(r".*organization/teamspace/model.*")
+
+# the teamspace resolved in a studio, built once and shared by all tests mocking the studio environment
+_STUDIO_TEAMSPACE = mock.MagicMock()
+_STUDIO_TEAMSPACE.name = LIT_TEAMSPACE
+_STUDIO_TEAMSPACE.owner.name = LIT_USER
+_RESOLVE_STUDIO_TEAMSPACE = mock.MagicMock(return_value=_STUDIO_TEAMSPACE)
+_RESOLVE_NO_TEAMSPACE = mock.MagicMock(return_value=None)
+# SDK attributes replaced when mocking a studio; patched in place because swapping `sys.modules` entries
+# would not rebind the names `lightning_sdk.models` has already imported
+_STUDIO_MOCKED_ATTRS = (
+    "lightning_sdk.organization.Organization",
+    "lightning_sdk.teamspace.Teamspace",
+    "lightning_sdk.teamspace.TeamspaceApi",
+    "lightning_sdk.models.TeamspaceApi",
+    "lightning_sdk.models._get_teamspace",
+)
+
+
+@pytest.fixture
+def studio_env(request, monkeypatch) -> bool:
+    """Mock the SDK as it would run inside a studio when parametrized with True; return that flag."""
+    in_studio = request.param
+    if not in_studio:
+        monkeypatch.setattr("lightning_sdk.models._resolve_teamspace", _RESOLVE_NO_TEAMSPACE)
+        return False
+    monkeypatch.setattr("lightning_sdk.models._resolve_teamspace", _RESOLVE_STUDIO_TEAMSPACE)
+    # mock env variables as it would run in studio
+    monkeypatch.setenv("LIGHTNING_USERNAME", LIT_USER)
+    monkeypatch.setenv("LIGHTNING_TEAMSPACE", LIT_TEAMSPACE)
+    for target in _STUDIO_MOCKED_ATTRS:
+        monkeypatch.setattr(target, mock.MagicMock)
+    return True
+
+
+def _new_svc() -> Any:
+    """Create a dummy SVC model, importing scikit-learn only for the tests which need it."""
+    from sklearn import svm
+
+    return svm.SVC()
+
+
+def _svc_class() -> type:
+    """Get the SVC class, skipping the test if scikit-learn is not installed."""
+    return pytest.importorskip("sklearn.svm").SVC
+
+
+@cache
+def _pickled_svc_bytes() -> bytes:
+    """Pickle a dummy SVC model once per session."""
+    return pickle.dumps(_new_svc(), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@cache
+def _scripted_module_bytes() -> bytes:
+    """Compile and serialize a dummy TorchScript module once per session."""
+    buffer = io.BytesIO()
+    torch_jit.save(torch_jit.script(Module()), buffer)
+    return buffer.getvalue()
 
-@pytest.mark.parametrize("name", ["/too/many/slashes", "org/model", "model-name"])
-@pytest.mark.parametrize("in_studio", [True, False])
-@mock.patch("litmodels.io.cloud.sdk_upload_model")
-def test_upload_wrong_model_name(mock_sdk_upload, name, in_studio, monkeypatch):
-    teamspace = mock.MagicMock()
-    teamspace.name = LIT_TEAMSPACE
-    teamspace.owner.name = LIT_USER
-    monkeypatch.setattr(
-        "lightning_sdk.models._resolve_teamspace", mock.MagicMock(return_value=teamspace if in_studio else None)
-    )
 
-    if in_studio:
-        # mock env variables as it would run in studio
-        monkeypatch.setenv("LIGHTNING_USERNAME", LIT_USER)
-        monkeypatch.setenv("LIGHTNING_TEAMSPACE", LIT_TEAMSPACE)
-        monkeypatch.setattr("lightning_sdk.organization.Organization", mock.MagicMock)
-        monkeypatch.setattr("lightning_sdk.teamspace.Teamspace", mock.MagicMock)
-        monkeypatch.setattr("lightning_sdk.teamspace.TeamspaceApi", mock.MagicMock)
-        monkeypatch.setattr("lightning_sdk.models._get_teamspace", mock.MagicMock)
+def _upload_model_files(name: str) -> None:
+    upload_model_files(path="path/to/checkpoint", name=name)
 
-    in_studio_only_name = in_studio and name == "model-name"
-    with (
-        pytest.raises(ValueError, match=r".*organization/teamspace/model.*")
-        if not in_studio_only_name
-        else nullcontext()
-    ):
-        upload_model_files(path="path/to/checkpoint", name=name)
+
+def _download_model(name: str) -> None:
+    download_model(name=name)
 
 
 @pytest.mark.parametrize("name", ["/too/many/slashes", "org/model", "model-name"])
-@pytest.mark.parametrize("in_studio", [True, False])
+@pytest.mark.parametrize("studio_env", [True, False], ids=["in_studio", "outside_studio"], indirect=True)
+@pytest.mark.parametrize("op", [_upload_model_files, _download_model], ids=["upload", "download"])
 @mock.patch("litmodels.io.cloud.sdk_download_model")
-def test_download_wrong_model_name(mock_sdk_download, name, in_studio, monkeypatch):
-    teamspace = mock.MagicMock()
-    teamspace.name = LIT_TEAMSPACE
-    teamspace.owner.name = LIT_USER
-    monkeypatch.setattr(
-        "lightning_sdk.models._resolve_teamspace", mock.MagicMock(return_value=teamspace if in_studio else None)
-    )
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_wrong_model_name(mock_sdk_upload, mock_sdk_download, op, name, studio_env):
+    in_studio_only_name = studio_env and name == "model-name"
+    with pytest.raises(ValueError, match=_NAME_ERROR_RE) if not in_studio_only_name else nullcontext():
+        op(name)
+
 
-    if in_studio:
-        # mock env variables as it would run in studio
-        monkeypatch.setenv("LIGHTNING_USERNAME", LIT_USER)
-        monkeypatch.setenv("LIGHTNING_TEAMSPACE", LIT_TEAMSPACE)
-        monkeypatch.setattr("lightning_sdk.organization.Organization", mock.MagicMock)
-        monkeypatch.setattr("lightning_sdk.teamspace.Teamspace", mock.MagicMock)
-        monkeypatch.setattr("lightning_sdk.models.TeamspaceApi", mock.MagicMock)
-    in_studio_only_name = in_studio and name == "model-name"
-    with (
-        pytest.raises(ValueError, match=r".*organization/teamspace/model.*")
-        if not in_studio_only_name
-        else nullcontext()
-    ):
-        download_model(name=name)
+@pytest.fixture(scope="module")
+def staging_root(tmp_path_factory) -> Path:
+    """One staging directory shared by the parametrized upload tests of this module."""
+    return tmp_path_factory.mktemp("staging")
+
+
+# SDK upload mock shared by the parametrized upload tests, reset at the start of each of them
+_UPLOAD_MOCK = mock.MagicMock()
+_UPLOAD_MOCK.return_value.name = "org-name/teamspace/model-name"
+
+# models are built only when a test runs, so collecting this module does not compile TorchScript
+_MODEL_FACTORIES = {
+    "torch_jit": lambda: torch_jit.load(io.BytesIO(_scripted_module_bytes())),
+    "module": Module,
+    "svc": _new_svc,
+}
 
 
 @pytest.mark.parametrize(
-    ("model", "model_path", "verbose"),
+    ("model_kind", "file_name", "verbose"),
     [
-        # ("path/to/checkpoint", "path/to/checkpoint", False),
-        # (BoringModel(), "%s/BoringModel.ckpt"),
-        (torch_jit.script(Module()), f"%s{os.path.sep}RecursiveScriptModule.ts", True),
-        (Module(), f"%s{os.path.sep}Module.pth", True),
-        (svm.SVC(), f"%s{os.path.sep}SVC.pkl", 1),
+        # (BoringModel(), "BoringModel.ckpt"),
+        ("torch_jit", "RecursiveScriptModule.ts", True),
+        ("module", "Module.pth", True),
+        ("svc", "SVC.pkl", 1),
     ],
 )
-@mock.patch("litmodels.io.cloud.sdk_upload_model")
-def test_upload_model(mock_upload_model, tmp_path, model, model_path, verbose):
-    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+@mock.patch("litmodels.io.cloud.sdk_upload_model", new=_UPLOAD_MOCK)
+def test_upload_model(staging_root, model_kind, file_name, verbose):
+    _UPLOAD_MOCK.reset_mock()
+    model = _MODEL_FACTORIES[model_kind]()
+    staging_dir = staging_root / model_kind
+    staging_dir.mkdir(exist_ok=True)
 
     # The lit-logger function is just a wrapper around the SDK function
     save_model(
         model=model,
         name="org-name/teamspace/model-name",
         cloud_account="cluster_id",
-        staging_dir=str(tmp_path),
+        staging_dir=str(staging_dir),
         verbose=verbose,
     )
-    expected_path = model_path % str(tmp_path) if "%" in model_path else model_path
-    mock_upload_model.assert_called_once_with(
-        path=expected_path,
+    _UPLOAD_MOCK.assert_called_once_with(
+        path=os.path.join(str(staging_dir), file_name),
         name="org-name/teamspace/model-name",
         cloud_account="cluster_id",
         progress_bar=True,
@@ -116,12 +164,21 @@ def test_download_model(mock_download_model):
     )
 
 
+@pytest.mark.parametrize(
+    ("file_name", "artifact", "model_class"),
+    [
+        ("dummy_model.pkl", _pickled_svc_bytes, _svc_class),
+        ("dummy_model.ts", _scripted_module_bytes, lambda: torch.jit.ScriptModule),
+    ],
+    ids=["pickle", "torch_jit"],
+)
 @mock.patch("litmodels.io.cloud.sdk_download_model")
-def test_load_model_pickle(mock_download_model, tmp_path):
+def test_load_model(mock_download_model, tmp_path, file_name, artifact, model_class):
+    # resolved first, so a row whose library is missing is skipped before its artifact is built
+    expected_type = model_class()
     # create a dummy model file
-    model_file = tmp_path / "dummy_model.pkl"
-    test_data = svm.SVC()
-    joblib.dump(test_data, model_file)
+    model_file = tmp_path / file_name
+    model_file.write_bytes(artifact())
     mock_download_model.return_value = [str(model_file.name)]
 
     # The lit-logger function is just a wrapper around the SDK function
@@ -132,29 +189,35 @@ def test_load_model_pickle(mock_download_model, tmp_path):
     mock_download_model.assert_called_once_with(
         name="org-name/teamspace/model-name", download_dir=str(tmp_path), progress_bar=True
     )
-    assert isinstance(model, svm.SVC)
+    assert isinstance(model, expected_type)
 
 
-@mock.patch("litmodels.io.cloud.sdk_download_model")
-def test_load_model_torch_jit(mock_download_model, tmp_path):
-    # create a dummy model file
-    model_file = tmp_path / "dummy_model.ts"
-    test_data = torch_jit.script(Module())
-    test_data.save(model_file)
-    mock_download_model.return_value = [str(model_file.name)]
+@pytest.mark.parametrize("obj", [torch.arange(6.0), {"weights": [1, 2, 3]}])
+def test_dump_load_pickle(obj, tmp_path):
+    from litmodels.io.utils import _is_torch_archive, dump_pickle, load_pickle
 
-    # The lit-logger function is just a wrapper around the SDK function
-    model = load_model(
-        name="org-name/teamspace/model-name",
-        download_dir=str(tmp_path),
-    )
-    mock_download_model.assert_called_once_with(
-        name="org-name/teamspace/model-name", download_dir=str(tmp_path), progress_bar=True
-    )
-    assert isinstance(model, torch.jit.ScriptModule)
+    path = tmp_path / "model.pkl"
+    dump_pickle(obj, path)
+    # tensors are written by torch, everything else by joblib
+    assert _is_torch_archive(path) == isinstance(obj, torch.Tensor)
+    loaded = load_pickle(path)
+    if isinstance(obj, torch.Tensor):
+        assert torch.equal(loaded, obj)
+    else:
+        assert loaded == obj
+
+
+def test_dump_load_pickle_without_joblib(tmp_path, monkeypatch):
+    from litmodels.io.utils import dump_pickle, load_pickle
 
+    monkeypatch.setattr("litmodels.io.utils._JOBLIB_AVAILABLE", False)
+    path = tmp_path / "model.pkl"
+    obj = {"weights": list(range(10)), "name": "model"}
+    dump_pickle(obj, path)
+    assert load_pickle(path) == obj
 
-@pytest.mark.skipif(not _KERAS_AVAILABLE, reason="TensorFlow/Keras is not available")
+
+@pytest.mark.skipif(not _keras_available(), reason="TensorFlow/Keras is not available")
 @mock.patch("litmodels.io.cloud.sdk_download_model")
 def test_load_model_tf_keras(mock_download_model, tmp_path):
     from tensorflow import keras
@@ -180,3 +243,251 @@ def test_load_model_tf_keras(mock_download_model, tmp_path):
         name="org-name/teamspace/model-name", download_dir=str(tmp_path), progress_bar=True
     )
     assert isinstance(model, keras.models.Model)
+
+
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_model_registered_serializer(mock_upload_model, tmp_path, monkeypatch):
+    from litmodels.io import gateway, register_serializer
+
+    monkeypatch.setattr(gateway, "_SERIALIZERS", dict(gateway._SERIALIZERS))
+    monkeypatch.setattr(gateway, "_SERIALIZER_CACHE", {})
+
+    class Exportable:
+        def export(self, path):
+            Path(path).write_text("exported")
+
+    class SubExportable(Exportable):
+        pass
+
+    register_serializer(Exportable, "onnx", lambda model, path: model.export(path))
+    for model in (Exportable(), SubExportable()):
+        save_model(model=model, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), verbose=0)
+        path = mock_upload_model.call_args.kwargs["path"]
+        assert path == os.path.join(str(tmp_path), f"{model.__class__.__name__}.onnx")
+        assert Path(path).read_text() == "exported"
+    assert set(gateway._SERIALIZER_CACHE) == {Exportable, SubExportable}
+
+
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_model_standalone_keras(mock_upload_model, tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from litmodels.io import gateway
+
+    monkeypatch.setattr(gateway, "_SERIALIZER_CACHE", {})
+    monkeypatch.delitem(sys.modules, "keras", raising=False)
+
+    class Model:
+        def save(self, path):
+            Path(path).write_text("keras")
+
+    class Classifier(Model):
+        pass
+
+    # falling back to pickle is not cached, Keras may still be imported later
+    assert gateway._resolve_serializer(Classifier) is gateway._save_pickle
+    assert Classifier not in gateway._SERIALIZER_CACHE
+
+    monkeypatch.setitem(sys.modules, "keras", SimpleNamespace(Model=Model))
+    save_model(model=Classifier(), name="org-name/teamspace/model-name", staging_dir=str(tmp_path), verbose=0)
+    assert mock_upload_model.call_args.kwargs["path"] == os.path.join(str(tmp_path), "Classifier.keras")
+    assert gateway._SERIALIZER_CACHE[Classifier] is gateway._save_keras
+
+
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_model_precision(mock_upload_model, tmp_path):
+    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+    model = torch.nn.Linear(4, 2)
+    save_model(
+        model=model, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), verbose=0, precision="bf16"
+    )
+    saved = torch.load(mock_upload_model.call_args.kwargs["path"])
+    assert all(v.dtype == torch.bfloat16 for v in saved.values())
+    assert mock_upload_model.call_args.kwargs["metadata"]["litModels.precision"] == "bf16"
+    # the model itself keeps its precision
+    assert model.weight.dtype == torch.float32
+
+    with pytest.raises(ValueError, match="Unsupported precision"):
+        save_model(model=model, name="org-name/teamspace/model-name", precision="int4")
+    with pytest.raises(ValueError, match="only supported for PyTorch nn.Module"):
+        save_model(model=_new_svc(), name="org-name/teamspace/model-name", precision="fp16")
+
+
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_model_reuses_staging_dir(mock_upload_model):
+    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+
+    save_model(model=Module(), name="org-name/teamspace/model-name", verbose=0)
+    save_model(model=Module(), name="org-name/teamspace/model-name", verbose=0)
+    first_path, second_path = (call.kwargs["path"] for call in mock_upload_model.call_args_list)
+    assert first_path == second_path
+    assert os.path.basename(os.path.dirname(first_path)).startswith("litmodels-")
+    # the serialized model is removed after the upload while the folder is kept for the next save
+    assert not os.path.exists(first_path)
+    assert os.path.isdir(os.path.dirname(first_path))
+
+
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_model_non_blocking(mock_upload_model, tmp_path):
+    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+    model = torch.nn.Linear(4, 2)
+    expected = {k: v.clone() for k, v in model.state_dict().items()}
+
+    future = save_model(model=model, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), blocking=False)
+    # updating the weights right away does not affect what is being saved
+    with torch.no_grad():
+        model.weight.add_(1)
+    assert future.result().name == "org-name/teamspace/model-name"
+    saved = torch.load(tmp_path / "Linear.pth")
+    assert all(torch.equal(saved[k], v) for k, v in expected.items())
+    mock_upload_model.assert_called_once_with(
+        path=os.path.join(str(tmp_path), "Linear.pth"),
+        name="org-name/teamspace/model-name",
+        cloud_account=None,
+        progress_bar=True,
+        metadata={"litModels": litmodels.__version__, "litModels.integration": "save_model"},
+    )
+
+
+@pytest.mark.skipif(not _SAFETENSORS_AVAILABLE, reason="safetensors is not available")
+@mock.patch("litmodels.io.cloud.sdk_download_model")
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_load_model_safetensors(mock_upload_model, mock_download_model, tmp_path):
+    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+    model = torch.nn.Linear(4, 2)
+    save_model(
+        model=model, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), verbose=0, format="safetensors"
+    )
+    assert mock_upload_model.call_args.kwargs["path"] == os.path.join(str(tmp_path), "Linear.safetensors")
+
+    mock_download_model.return_value = ["Linear.safetensors"]
+    state_dict = load_model(name="org-name/teamspace/model-name", download_dir=str(tmp_path))
+    assert all(torch.equal(state_dict[k], v) for k, v in model.state_dict().items())
+
+    # tied weights cannot be stored with safetensors
+    tied = torch.nn.Sequential(torch.nn.Linear(4, 4, bias=False), torch.nn.Linear(4, 4, bias=False))
+    tied[1].weight = tied[0].weight
+    with pytest.raises(ValueError, match="cannot be saved with safetensors"):
+        save_model(model=tied, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), format="safetensors")
+
+
+@mock.patch("litmodels.io.cloud.sdk_download_model")
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_save_load_model_state_dict(mock_upload_model, mock_download_model, tmp_path):
+    mock_upload_model.return_value.name = "org-name/teamspace/model-name"
+    model = torch.nn.Linear(4, 2)
+    save_model(model=model, name="org-name/teamspace/model-name", staging_dir=str(tmp_path), verbose=0)
+    assert mock_upload_model.call_args.kwargs["path"] == os.path.join(str(tmp_path), "Linear.pth")
+
+    mock_download_model.return_value = ["Linear.pth"]
+    state_dict = load_model(name="org-name/teamspace/model-name", download_dir=str(tmp_path))
+    assert all(torch.equal(state_dict[k], v) for k, v in model.state_dict().items())
+
+    with pytest.raises(ValueError, match="Unsupported format"):
+        save_model(model=model, name="org-name/teamspace/model-name", format="onnx")
+    with pytest.raises(ValueError, match="only supported for PyTorch nn.Module"):
+        save_model(model=_new_svc(), name="org-name/teamspace/model-name", format="safetensors")
+
+
+@pytest.mark.skipif(not _ZSTANDARD_AVAILABLE, reason="zstandard is not available")
+@mock.patch("litmodels.io.cloud._COMPRESSION_MIN_SIZE", 1024)
+@mock.patch("litmodels.io.cloud.sdk_download_model")
+@mock.patch("litmodels.io.cloud.sdk_upload_model")
+def test_upload_download_compressed(mock_upload_model, mock_download_model, tmp_path):
+    checkpoint = tmp_path / "model.ckpt"
+    payload = os.urandom(1024) * 8
+    checkpoint.write_bytes(payload)
+    uploaded = {}
+
+    def _upload(path, **kwargs):
+        uploaded["name"] = os.path.basename(path)
+        uploaded["data"] = Path(path).read_bytes()
+
+    mock_upload_model.side_effect = _upload
+    upload_model_files(name="org-name/teamspace/model-name", path=checkpoint, compression="zstd", verbose=0)
+    assert uploaded["name"] == "model.ckpt.litmodels.zst"
+    assert len(uploaded["data"]) < len(payload)
+    assert mock_upload_model.call_args.kwargs["metadata"]["litModels.compression"] == "zstd"
+    # the temporary compressed file is removed after upload
+    assert sorted(os.listdir(tmp_path)) == ["model.ckpt"]
+
+    download_dir = tmp_path / "download"
+    download_dir.mkdir()
+    (download_dir / "model.ckpt.litmodels.zst").write_bytes(uploaded["data"])
+    # user artifacts with a plain '.zst' suffix are left untouched
+    (download_dir / "data.zst").write_bytes(b"user data")
+    mock_download_model.return_value = ["model.ckpt.litmodels.zst", "data.zst"]
+    paths = download_model(name="org-name/teamspace/model-name", download_dir=str(download_dir))
+    assert paths == ["model.ckpt", "data.zst"]
+    assert (download_dir / "model.ckpt").read_bytes() == payload
+    assert not (download_dir / "model.ckpt.litmodels.zst").exists()
+    assert (download_dir / "data.zst").read_bytes() == b"user data"
+
+
+@mock.patch("litmodels.io.cloud._ZSTANDARD_AVAILABLE", False)
+@mock.patch("litmodels.io.cloud.sdk_download_model")
+def test_download_compressed_without_zstandard(mock_download_model, tmp_path):
+    mock_download_model.return_value = ["model.ckpt.litmodels.zst"]
+    with pytest.raises(ModuleNotFoundError, match="requires `zstandard`"):
+        download_model(name="org-name/teamspace/model-name", download_dir=str(tmp_path))
+
+
+def test_upload_unsupported_compression():
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        upload_model_files(name="org-name/teamspace/model-name", path="model.ckpt", compression="gzip")
+
+
+@mock.patch("lightning_sdk.utils.resolve._get_authed_user")
+@mock.patch("lightning_sdk.api.UserApi")
+@mock.patch("lightning_sdk.api.OrgApi")
+def test_list_available_teamspaces(mock_org_api, mock_user_api, mock_authed_user):
+    from litmodels.io.cloud import _list_available_teamspaces
+
+    mock_authed_user.return_value.name = "my-user"
+    memberships = [
+        mock.Mock(owner_type="organization", owner_id="org-1"),
+        mock.Mock(owner_type="organization", owner_id="org-2"),
+        mock.Mock(owner_type="organization", owner_id="org-1"),
+        mock.Mock(owner_type="user", owner_id="user"),
+    ]
+    for i, ts in enumerate(memberships):
+        ts.name = f"ts-{i}"
+    mock_user_api.return_value._get_all_teamspace_memberships.return_value = memberships
+
+    def _get_org(org_id):
+        org = mock.Mock()
+        org.name = f"{org_id}-name"
+        return org
+
+    mock_org_api.return_value._get_org_by_id.side_effect = _get_org
+
+    teamspaces = _list_available_teamspaces()
+    assert list(teamspaces) == ["org-1-name/ts-0", "org-2-name/ts-1", "org-1-name/ts-2", "my-user/ts-3"]
+    # each organization is resolved only once
+    assert sorted(c.args[0] for c in mock_org_api.return_value._get_org_by_id.call_args_list) == ["org-1", "org-2"]
+
+
+@mock.patch("litmodels.io.cloud.sdk_download_model")
+def test_download_model_cached(mock_download_model, tmp_path, monkeypatch):
+    monkeypatch.setenv("LITMODELS_CACHE_DIR", str(tmp_path / "cache"))
+
+    def _download(name, download_dir, progress_bar):
+        # like the SDK, create the download folder if needed
+        Path(download_dir).mkdir(parents=True, exist_ok=True)
+        Path(download_dir, "model.pkl").write_bytes(b"weights")
+        return ["model.pkl"]
+
+    mock_download_model.side_effect = _download
+    for folder in ("first", "second"):
+        paths = download_model(
+            name="org-name/teamspace/model-name:v1", download_dir=str(tmp_path / folder), use_cache=True
+        )
+        assert paths == ["model.pkl"]
+        assert (tmp_path / folder / "model.pkl").read_bytes() == b"weights"
+        # the file shares its content with the cache entry, so it must not be writable
+        assert not (tmp_path / folder / "model.pkl").stat().st_mode & 0o222
+    assert mock_download_model.call_count == 1
+
+    # the latest version can change at any time so it is never cached
+    download_model(name="org-name/teamspace/model-name", download_dir=str(tmp_path / "latest"), use_cache=True)
+    assert mock_download_model.call_count == 2